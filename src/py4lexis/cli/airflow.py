@@ -5,6 +5,12 @@ from py4lexis.workflows.airflow import Airflow
 from tabulate import tabulate
 from json import dumps
 
+
+# Columns of the ASCII tables
+_WORKFLOWS_COLS: tuple[str, ...] = ("WorkflowID (dag_id)", "Description", "Is subdag", "Is active", "Is paused")
+_WORKFLOW_STATES_COLS: tuple[str, ...] = ("WorkflowRunID", "ExecutionDate", "State")
+
+
 class AirflowCLI(object):
     """
         A class holds methods to manage DAGs within Lexis Airflow instance using INTERACTIVE mode.
@@ -65,15 +71,14 @@ class AirflowCLI(object):
             try:
                 print(f"Formatting pandas DataFrame into ASCII table...")
                 
-                cols: list[str] = ["WorkflowID (dag_id)", "Description", "Is subdag", "Is active", "Is paused"]
-                workflows_table: DataFrame = DataFrame(columns=cols)
+                workflows_table: DataFrame = DataFrame(columns=list(_WORKFLOWS_COLS))
                 workflows_table["WorkflowID (dag_id)"] = content["dag_id"]
                 workflows_table["Description"] = content["description"]
                 workflows_table["Is subdag"] = content["is_subdag"]
                 workflows_table["Is active"] = content["is_active"]
                 workflows_table["Is paused"] = content["is_paused"]
                 
-                print(tabulate(workflows_table.values.tolist(), cols, tablefmt="grid"))
+                print(tabulate(workflows_table.itertuples(index=False, name=None), _WORKFLOWS_COLS, tablefmt="grid"))
 
 
             except KeyError as kerr:
@@ -196,8 +201,7 @@ class AirflowCLI(object):
 
         if req_status is not None:
                 
-            cols: list[str] = ["WorkflowRunID", "ExecutionDate", "State"]
-            workflows_table: DataFrame = DataFrame(columns=cols)
+            workflows_table: DataFrame = DataFrame(columns=list(_WORKFLOW_STATES_COLS))
             workflows_table["WorkflowRunID"] = content["workflow_run_id"]
             workflows_table["ExecutionDate"] = content["execution_date"]
             workflows_table["State"] = content["state"]
@@ -219,6 +223,6 @@ class AirflowCLI(object):
                 print(f"WARNING: Filters can't be determined. Returning all states.")
                 self.session.logging.warn(f"GET -- WORKFLOW STATE -- Filters can't be determined. Returning all states. -- WARN")
 
-            print(tabulate(workflows_table.values.tolist(), cols, tablefmt="grid"))
+            print(tabulate(workflows_table.itertuples(index=False, name=None), _WORKFLOW_STATES_COLS, tablefmt="grid"))
 
             
\ No newline at end of file
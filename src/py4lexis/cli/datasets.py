@@ -1,20 +1,95 @@
 from __future__ import annotations
-from typing import Generator, Optional
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterable, Iterator, Optional
+from numbers import Number
+from collections import deque
+from itertools import chain, islice
 from py4lexis.session import LexisSession
-from py4lexis.ddi.datasets import Datasets
-from py4lexis.directory_tree import DirectoryTree
-from py4lexis.custom_types.directory_tree import TreeDirectoryObject
-from datetime import date, datetime
-from pandas import DataFrame
-# Making ASCII table
-# Source: https://stackoverflow.com/questions/5909873/how-can-i-pretty-print-ascii-tables-with-python
-from tabulate import tabulate
+from py4lexis.ddi.datasets import Datasets, _DEFAULT_CONTRIBUTOR, _DEFAULT_CREATOR, _DEFAULT_OWNER, \
+                                   _DEFAULT_PUBLISHER, _DEFAULT_RESOURCE_TYPE
+import functools
+import inspect
+import io
+import operator
+import sys
+import time
+
+# Heavy dependencies (pandas, numpy, tabulate) are imported by the methods printing the tables only when they are called
+if TYPE_CHECKING:
+    from pandas import DataFrame
+    import numpy as np
+    from py4lexis.directory_tree import DirectoryTree
+    from py4lexis.custom_types.directory_tree import TreeDirectoryObject
+
+
+# Columns of the ASCII tables
+_STATUS_COLS: tuple[str, ...] = ("Filename", "Project", "TaskState", "DatasetID", "TransferType")
+# Keys of the datasets' status content (and their defaults) matching _STATUS_COLS
+_STATUS_KEYS: tuple[tuple[str, str], ...] = (("filename", "UKNOWN Filename"), 
+                                             ("project", "UKNOWN Project"), 
+                                             ("task_state", "UKNOWN Task State"), 
+                                             ("dataset_id", "UKNOWN DatasetID"), 
+                                             ("transfer_type", "UKNOWN Transfer Type"))
+_ALL_DATASETS_COLS: tuple[str, ...] = ("Title", "Access", "Project", "Zone", "InternalID", "CreationDate")
+_LIST_OF_FILES_COLS: tuple[str, ...] = ("Filename", "Path", "Size", "CreateTime", "Checksum")
+# Columns indexing the cached table of all datasets
+_ALL_DATASETS_INDEX: tuple[str, ...] = ("Access", "Project", "Zone")
+# Number of rows formatted and written at once when printing a table
+_TABLE_PAGE_SIZE: int = 500
+# Number of rows printed in a table by default, the rest is skipped
+_MAX_ROWS: int = 100
+# Comparisons of the filter by size, applied to the whole column of sizes at once
+_SIZE_OPS: dict[str, Callable[[Any, Any], Any]] = {"eq": operator.eq, 
+                                                   "l": operator.lt, 
+                                                   "leq": operator.le, 
+                                                   "g": operator.gt, 
+                                                   "geq": operator.ge}
+# Number of files converted into one table by iter_files()
+_FILES_CHUNK_SIZE: int = 10000
+# Number of lines of the directory tree buffered before writing them to stdout
+_TREE_FLUSH_LINES: int = 1024
+# Responses of listing requests fetched within this time are reused by default
+_CACHE_TTL: float = 60.0 # secs
+
+
+def _with_default_zone(method: Callable) -> Callable:
+    """
+        Decorator of DatasetsCLI methods having the zone parameter. If the zone is empty or not given, 
+        it is replaced by the default zone of the session before the method is called.
+
+        Parameters
+        ----------
+        method : Callable
+            Method with the zone parameter.
+
+        Return
+        ------
+        Callable
+            Wrapped method.
+    """
+    # Position of zone within positional arguments (without self), found once when the method is decorated
+    zone_pos: int = list(inspect.signature(method).parameters).index("zone") - 1
+
+    @functools.wraps(method)
+    def wrapper(self: DatasetsCLI, *args, **kwargs):
+        if len(args) > zone_pos:
+            if not args[zone_pos]:
+                args = args[:zone_pos] + (self._default_zone,) + args[zone_pos + 1:]
+        elif not kwargs.get("zone"):
+            kwargs["zone"] = self._default_zone
+
+        return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class DatasetsCLI(object):
+    __slots__ = ("print_content", "session", "_default_zone", "datasets", "cache_ttl", "_cache")
+
     def __init__(self, 
                  session: LexisSession, 
-                 print_content: Optional[bool]=False):
+                 print_content: Optional[bool]=False,
+                 cache_ttl: Optional[float]=_CACHE_TTL,
+                 use_download_cache: Optional[bool]=False):
         """
             A class holds methods to manage datasets within LEXIS platform using INTERACTIVE mode.
 
@@ -24,6 +99,12 @@ class DatasetsCLI(object):
                 Class which holds LEXIS session
             print_content : bool, optional
                 If True then contents of all requests will be printed.
+            cache_ttl : float, optional
+                Responses of listing requests (datasets, their status and files) are reused for repeated calls within cache_ttl seconds.
+                Set to 0 to turn the caching off. By default: cache_ttl=60.
+            use_download_cache : bool, optional
+                If True then downloaded datasets are kept in a local cache and reused while their files have not changed. 
+                By default: use_download_cache=False.
 
             Methods
             -------
@@ -32,13 +113,13 @@ class DatasetsCLI(object):
                            push_method: Optional[str]="empty", 
                            zone: Optional[str]="IT4ILexisZone",
                            path: Optional[str]="", 
-                           contributor: Optional[list[str]]=["UNKNOWN contributor"], 
-                           creator: Optional[list[str]]=["UNKNOWN creator"],
-                           owner: Optional[list[str]]=["UNKNOWN owner"], 
-                           publicationYear: Optional[str]=str(date.today().year),
-                           publisher: Optional[list[str]]=["UNKNOWN publisher"], 
-                           resourceType: Optional[str]=str("UNKNOWN resource type"),
-                           title: Optional[str]=str("UNTITLED_Dataset_" + datetime.now().strftime("%d-%m-%Y_%H:%M:%S"))) -> None
+                           contributor: Optional[tuple[str, ...]]=("UNKNOWN contributor",), 
+                           creator: Optional[tuple[str, ...]]=("UNKNOWN creator",),
+                           owner: Optional[tuple[str, ...]]=("UNKNOWN owner",), 
+                           publicationYear: Optional[str]=None,
+                           publisher: Optional[tuple[str, ...]]=("UNKNOWN publisher",), 
+                           resourceType: Optional[str]="UNKNOWN resource type",
+                           title: Optional[str]=None) -> None
                 Create an empty dataset with specified attributes.
 
             tus_uploader_new(access: str, 
@@ -47,15 +128,17 @@ class DatasetsCLI(object):
                              zone: Optional[str]="IT4ILexisZone", 
                              file_path: Optional[str]="./",
                              path: Optional[str]="", 
-                             contributor: Optional[list[str]]=["NONAME contributor"], 
-                             creator: Optional[list[str]]=["NONAME creator"],
-                             owner: Optional[list[str]]=["NONAME owner"], 
-                             publicationYear: Optional[str]=str(date.today().year), 
-                             publisher: Optional[list[str]]=["NONAME publisher"],
-                             resourceType: Optional[str]="NONAME resource type", 
-                             title: Optional[str]="UNTITLED_TUS_Dataset_" + datetime.now().strftime("%d-%m-%Y_%H:%M:%S"), 
+                             contributor: Optional[tuple[str, ...]]=("UNKNOWN contributor",), 
+                             creator: Optional[tuple[str, ...]]=("UNKNOWN creator",),
+                             owner: Optional[tuple[str, ...]]=("UNKNOWN owner",), 
+                             publicationYear: Optional[str]=None, 
+                             publisher: Optional[tuple[str, ...]]=("UNKNOWN publisher",),
+                             resourceType: Optional[tuple[str, ...]]=("UNKNOWN resource type",), 
+                             title: Optional[str]=None, 
                              expand: Optional[str]="no", 
-                             encryption: Optional[str]="no") -> None
+                             encryption: Optional[str]="no",
+                             max_workers: Optional[int]=8,
+                             chunk_size: Optional[int]=None) -> None
                 Creates a new dataset with specified metadata and upload a file or whole directory tree to it.
 
             tus_uploader_rewrite(dataset_id: str,
@@ -66,27 +149,38 @@ class DatasetsCLI(object):
                                  zone: Optional[str]="IT4ILexisZone", 
                                  file_path: Optional[str]="./",
                                  path: Optional[str]="",                               
-                                 encryption: Optional[str]="no") -> None:
+                                 encryption: Optional[str]="no",
+                                 max_workers: Optional[int]=8,
+                                 chunk_size: Optional[int]=None) -> None:
                 Uploads a file or whole directory tree to existing dataset. If files already exist, it will rewrite them.
 
             get_dataset_status(filter_filename: Optional[str]="", 
                                filter_project: Optional[str]="", 
-                               filter_task_state: Optional[str]="") -> None
+                               filter_task_state: Optional[str]="",
+                               max_rows: Optional[int]=100) -> None
                 Prints datasets with status into table. Is possible to use filters to get filtered table by
                 filename, project, task_status.
 
             get_all_datasets(filter_title: Optional[str]="",
                              filter_access: Optional[str]="", 
                              filter_project: Optional[str]="", 
-                             filter_zone: Optional[str]="") -> None
+                             filter_zone: Optional[str]="",
+                             filter_internal_id: Optional[str]="",
+                             max_rows: Optional[int]=100) -> None
                 Prints a table of the all existing datasets. Is possible to use filters to get filtered table by
-                title, access, zone, project.
+                title, access, zone, project, internalID.
 
             delete_dataset_by_id(dataset_id: str, 
                                  access: str, 
                                  project: str) -> None
                 Deletes a dataset by a specified internalID.
 
+            delete_datasets_by_ids(dataset_ids: list[str], 
+                                   access: str, 
+                                   project: str,
+                                   max_workers: Optional[int]=8) -> None
+                Deletes several datasets at once, the requests are sent concurrently.
+
             download_dataset(acccess: str,
                              project: str,
                              dataset_id: str,
@@ -97,6 +191,9 @@ class DatasetsCLI(object):
                 It is possible to specify by path parameter which exact file in the dataset should be downloaded.
                 It is popsible to specify local desination folder. Default is set to = "./download.tar.gz"
 
+            download_datasets(datasets: list[dict], max_workers: Optional[int]=8) -> None
+                Downloads several datasets at once. Status of all submitted downloads is checked by a single request.
+
             get_list_of_files_in_dataset(dataset_id: str, 
                                          access: str,
                                          project: str, 
@@ -107,32 +204,50 @@ class DatasetsCLI(object):
                                          filename_compare_type: Optional[str]="",
                                          filter_size: Optional[int]=0,
                                          size_compare_type: Optional[str]="eq", 
-                                         filter_type: Optional[str]="") -> None:
+                                         filter_type: Optional[str]="",
+                                         max_rows: Optional[int]=100) -> None:
                 List all files within the dataset.
 
+            iter_files(dataset_id: str, 
+                       access: str,
+                       project: str, 
+                       zone: Optional[str]="",
+                       path: Optional[str]="",
+                       chunk_size: Optional[int]=10000) -> Generator[DataFrame, None, None]
+                Yields the table of files within the dataset in chunks of chunk_size rows.
+
             get_dataset_path(access: str, project: str, internalID: str, username: Optional[str]="") -> str
                 Prints a path for an existing dataset as the combination of access, project, internalID and username.
+
+            invalidate() -> None
+                Drops all cached responses of listing requests.
         """
         self.print_content: bool = print_content
         self.session: LexisSession = session
+        # Default zone of the session, used when no zone is given
+        self._default_zone: str = session.DFLT_Z
         self.datasets: Datasets = Datasets(session, 
                                            print_content=print_content, 
-                                           suppress_print=False)
+                                           suppress_print=False,
+                                           use_download_cache=use_download_cache)
+        self.cache_ttl: float = cache_ttl
+        self._cache: dict[tuple, tuple[float, tuple]] = {}
 
 
+    @_with_default_zone
     def create_dataset(self, 
                        access: str, 
                        project: str, 
                        push_method: Optional[str]="empty", 
                        zone: Optional[str]="",
                        path: Optional[str]="", 
-                       contributor: Optional[list[str]]=["UNKNOWN contributor"], 
-                       creator: Optional[list[str]]=["UNKNOWN creator"],
-                       owner: Optional[list[str]]=["UNKNOWN owner"], 
-                       publicationYear: Optional[str]=str(date.today().year),
-                       publisher: Optional[list[str]]=["UNKNOWN publisher"], 
-                       resourceType: Optional[str]=str("UNKNOWN resource type"),
-                       title: Optional[str]=str("UNTITLED_Dataset_" + datetime.now().strftime("%d-%m-%Y_%H:%M:%S"))) -> None:
+                       contributor: Optional[tuple[str, ...]]=_DEFAULT_CONTRIBUTOR, 
+                       creator: Optional[tuple[str, ...]]=_DEFAULT_CREATOR,
+                       owner: Optional[tuple[str, ...]]=_DEFAULT_OWNER, 
+                       publicationYear: Optional[str]=None,
+                       publisher: Optional[tuple[str, ...]]=_DEFAULT_PUBLISHER, 
+                       resourceType: Optional[str]=_DEFAULT_RESOURCE_TYPE,
+                       title: Optional[str]=None) -> None:
         """
             Creates an empty dataset with specified attributes
 
@@ -148,16 +263,16 @@ class DatasetsCLI(object):
                 iRODS zone name in which dataset will be stored, one of ["IT4ILexisZone", "LRZLexisZone"]. By default: "IT4ILexisZone".
             path: str, optional
                 By default: "./"
-            contributor: list[str], optional
-                By default: ["UNKNOWN contributor"].
-            creator: list[str], optional
-                By default: ["UNKNOWN creator"].
-            owner: list[str], optional
-                By default: ["UNKNOWN owner"].
+            contributor: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN contributor",).
+            creator: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN creator",).
+            owner: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN owner",).
             publicationYear: str, optional
                 By default: CURRENT_YEAR.
-            publisher: list[str], optional
-                By default: ["UNKNOWN publisher"].
+            publisher: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN publisher",).
             resourceType: str, optional
                 By default: "UNKNOWN resource type".
             title: str, optional
@@ -167,9 +282,6 @@ class DatasetsCLI(object):
             ------
             None
         """
-        if zone == "":
-            zone = self.session.DFLT_Z 
-
         _, _ = self.datasets.create_dataset(access, 
                                             project, 
                                             push_method, 
@@ -182,8 +294,10 @@ class DatasetsCLI(object):
                                             publisher, 
                                             resourceType, 
                                             title)
+        self.invalidate()
 
 
+    @_with_default_zone
     def tus_uploader_new(self, 
                          access: str, 
                          project: str, 
@@ -191,14 +305,16 @@ class DatasetsCLI(object):
                          zone: Optional[str]="", 
                          file_path: Optional[str]="./",
                          path: Optional[str]="", 
-                         contributor: Optional[list[str]]=["UNKNOWN contributor"], 
-                         creator: Optional[list[str]]=["UNKNOWN creator"],
-                         owner: Optional[list[str]]=["UNKNOWN owner"], 
-                         publicationYear: Optional[list[str]]=[str(date.today().year)], 
-                         publisher: Optional[list[str]]=["UNKNOWN publisher"],
-                         resourceType: Optional[list[str]]=["UNKNOWN resource type"], 
-                         title: Optional[list[str]]=["UNTITLED_TUS_Dataset_" + datetime.now().strftime("%d-%m-%Y_%H:%M:%S")], 
-                         encryption: Optional[str]="no") -> None:
+                         contributor: Optional[tuple[str, ...]]=_DEFAULT_CONTRIBUTOR, 
+                         creator: Optional[tuple[str, ...]]=_DEFAULT_CREATOR,
+                         owner: Optional[tuple[str, ...]]=_DEFAULT_OWNER, 
+                         publicationYear: Optional[list[str]]=None, 
+                         publisher: Optional[tuple[str, ...]]=_DEFAULT_PUBLISHER,
+                         resourceType: Optional[tuple[str, ...]]=(_DEFAULT_RESOURCE_TYPE,), 
+                         title: Optional[list[str]]=None, 
+                         encryption: Optional[str]="no",
+                         max_workers: Optional[int]=8,
+                         chunk_size: Optional[int]=None) -> None:
         """
             Creates a new dataset with specified metadata and upload a file or whole directory tree to it.
 
@@ -216,34 +332,38 @@ class DatasetsCLI(object):
                 Path to a file in user's machine. By default "./".
             path: str, optional
                 By default, root path is set, i.e. "./".
-            contributor: list[str], optional
-                By default: ["UNKNOWN contributor"].
-            creator: list[str], optional
-                By default: ["UNKNOWN creator"].
-            owner: list[str], optional
-                By default: ["UNKNOWN owner"].
+            contributor: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN contributor",).
+            creator: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN creator",).
+            owner: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN owner",).
             publicationYear: list[str], optional
                 By default: [CURRENT_YEAR].
-            publisher: list[str], optional
-                By default: ["UNKNOWN publisher"].
-            resourceType: list[str], optional
-                By default: ["UNKNOWN resource type"].
+            publisher: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN publisher",).
+            resourceType: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN resource type",).
             title: list[str], optional
                 By default: ["UNTITLED_Dataset_" + TIMESTAMP].
             encryption: str, optional
                 By default: "no".
+            max_workers: int, optional
+                Maximum number of files uploaded concurrently if filename is a directory. By default: max_workers=8.
+            chunk_size: int, optional
+                Size of the chunks sent by TUS in bytes. By default, it is chosen for each file as 1/200 of its size,
+                but at least 8 MiB and at most 64 MiB.
 
             Returns
             -------
             None
         """
-        if zone == "":
-            zone = self.session.DFLT_Z 
-
         self.datasets.tus_uploader_new(access, project, filename, zone, file_path, path, contributor, creator, owner, publicationYear,
-                                       publisher, resourceType, title, encryption)
+                                       publisher, resourceType, title, encryption, max_workers, chunk_size)
+        self.invalidate()
         
 
+    @_with_default_zone
     def tus_uploader_rewrite(self, 
                              dataset_id: str,
                              dataset_title: str,
@@ -253,7 +373,9 @@ class DatasetsCLI(object):
                              zone: Optional[str]="", 
                              file_path: Optional[str]="./",
                              path: Optional[str]="",  
-                             encryption: Optional[str]="no") -> None:
+                             encryption: Optional[str]="no",
+                             max_workers: Optional[int]=8,
+                             chunk_size: Optional[int]=None) -> None:
         """
             Uploads a file or whole directory tree to existing dataset. If files already exist, it will rewrite them.
 
@@ -277,22 +399,26 @@ class DatasetsCLI(object):
                 By default, root path is set, i.e. "./".
             encryption: str, optional
                 By default: "no".
+            max_workers: int, optional
+                Maximum number of files uploaded concurrently if filename is a directory. By default: max_workers=8.
+            chunk_size: int, optional
+                Size of the chunks sent by TUS in bytes. By default, it is chosen for each file as 1/200 of its size,
+                but at least 8 MiB and at most 64 MiB.
 
             Returns
             -------
             None
         """
-        if zone == "":
-            zone = self.session.DFLT_Z 
-
         self.datasets.tus_uploader_rewrite(dataset_id, dataset_title, access, project, filename,
-                                           zone, file_path, path, encryption)
+                                           zone, file_path, path, encryption, max_workers, chunk_size)
+        self.invalidate()
 
 
     def get_dataset_status(self, 
                            filter_filename: Optional[str]="", 
                            filter_project: Optional[str]="", 
-                           filter_task_state: Optional[str]="") -> None:
+                           filter_task_state: Optional[str]="",
+                           max_rows: Optional[int]=_MAX_ROWS) -> None:
         """
             Prints datasets with status into table. Is possible to use filters to get filtered table by
             filename, project, task_status.
@@ -305,41 +431,36 @@ class DatasetsCLI(object):
                 To filter table of datasets by project. By default: "" (i.e. filter is off).
             filter_task_state : str, optional
                 To filter table of datasets by task_state. One of ["PENDING", "SUCCESS"]. By default: "" (i.e. filter is off).
+            max_rows : int, optional
+                Maximum number of printed rows. If there are more rows, only the first and the last max_rows/2 rows are printed.
+                If None, all rows are printed. By default: max_rows=100.
         """
-
-        content, req_status = self.datasets.get_dataset_status(content_as_pandas=True)
+        content, req_status = self._cached(("get_dataset_status",), 
+                                           lambda: self.datasets.get_dataset_status(content_as_pandas=False))
 
         if req_status is not None:
-            try:
-                print(f"Formatting pandas DataFrame into ASCII table...")
-                
-                cols: list[str] = ["Filename", "Project", "TaskState", "DatasetID", "TransferType"]
-                datasets_table: DataFrame = content[cols]
-
-                if filter_filename != "":
-                    datasets_table = datasets_table[datasets_table["Filename"] == filter_filename]
+            print(f"Formatting datasets' status into ASCII table...")
 
-                if filter_project != "":
-                    datasets_table = datasets_table[datasets_table["Project"] == filter_project]
-
-                if filter_task_state != "":
-                    datasets_table = datasets_table[datasets_table["TaskState"] == filter_task_state]
+            # Active filters as (column, value) pairs, all of them are checked in a single pass over the rows
+            filters: list[tuple[int, str]] = [(i, value) for i, value in enumerate((filter_filename, filter_project, filter_task_state)) 
+                                              if value != ""]
+            rows: Generator[tuple[str, ...], None, None] = (row for row in (tuple(status.get(key, default) for key, default in _STATUS_KEYS) 
+                                                                            for status in content)
+                                                            if all(row[i] == value for i, value in filters))
 
-                print(tabulate(datasets_table.values.tolist(), cols, tablefmt="grid"))
-
-            except KeyError as kerr:
-                self.session.logging.error(f"Wrong or missing key '{kerr}' in response content as DataFrame!!!")
-                print(f"Wrong or missing key '{kerr}' in response content as DataFrame!!!")
+            self._print_table(rows, _STATUS_COLS, max_rows)
 
 
     def get_all_datasets(self, 
                          filter_title: Optional[str]="",
                          filter_access: Optional[str]="", 
                          filter_project: Optional[str]="", 
-                         filter_zone: Optional[str]="") -> None:
+                         filter_zone: Optional[str]="",
+                         filter_internal_id: Optional[str]="",
+                         max_rows: Optional[int]=_MAX_ROWS) -> None:
         """
             Prints a table of the all existing datasets. Is possible to use filters to get filtered table by
-            title, access, zone, project.
+            title, access, zone, project, internalID. The table is reused for repeated calls within cache_ttl.
 
             Parameters
             ----------
@@ -351,34 +472,210 @@ class DatasetsCLI(object):
                 To filter table of datasets by project. By default: "" (i.e. filter is off).
             filter_zone : str, optional
                 To filter table of datasets by title. By default: "" (i.e. filter is off).
+            filter_internal_id : str, optional
+                To get only the dataset with the InternalID. Only this dataset is requested from the server and other filters are ignored.
+                By default: "" (i.e. filter is off).
+            max_rows : int, optional
+                Maximum number of printed rows. If there are more rows, only the first and the last max_rows/2 rows are printed.
+                If None, all rows are printed. By default: max_rows=100.
         """
-
-        content, req_status = self.datasets.get_all_datasets(content_as_pandas=True)
+        try:
+            datasets_table: DataFrame | None = None
+            if filter_internal_id != "":
+                content, req_status = self.datasets.get_dataset_by_id(filter_internal_id, content_as_pandas=True)
+                if req_status is not None:
+                    print(f"Formatting pandas DataFrame into ASCII table...")
+                    self._print_table(content[list(_ALL_DATASETS_COLS)].itertuples(index=False, name=None), _ALL_DATASETS_COLS, max_rows)
+                return
+
+            datasets_table = self._get_all_datasets_table({"access": filter_access, "project": filter_project, "zone": filter_zone})
         
-        if req_status is not None:
-            try:
+            if datasets_table is not None:
                 print(f"Formatting pandas DataFrame into ASCII table...")
-                
-                cols: list[str] = ["Title", "Access", "Project", "Zone", "InternalID", "CreationDate"]
-                datasets_table: DataFrame = content[cols]
 
-                if filter_title != "":
-                    datasets_table = datasets_table[datasets_table["Title"] == filter_title]
-                
+                # Location filters are applied by the server already, they are re-applied in case the server ignores some of them
+                levels: list[str] = []
+                keys: list[str] = []
                 if filter_access != "":
-                    datasets_table = datasets_table[datasets_table["Access"] == filter_access]
+                    levels.append("Access")
+                    keys.append(filter_access)
 
                 if filter_project != "":
-                    datasets_table = datasets_table[datasets_table["Project"] == filter_project]
+                    levels.append("Project")
+                    keys.append(filter_project)
 
                 if filter_zone != "":
-                    datasets_table = datasets_table[datasets_table["Zone"] == filter_zone]
+                    levels.append("Zone")
+                    keys.append(filter_zone)
 
-                print(tabulate(datasets_table.values.tolist(), cols, tablefmt="grid"))
+                if len(levels) > 0:
+                    try:
+                        datasets_table = datasets_table.xs(tuple(keys), level=levels, drop_level=False)
+                    except KeyError:
+                        # No dataset matches the filters
+                        datasets_table = datasets_table.iloc[0:0]
 
-            except KeyError as kerr:
-                self.session.logging.error(f"Wrong or missing key '{kerr}' in response content as DataFrame!!!")
-                print(f"Wrong or missing key '{kerr}' in response content as DataFrame!!!")
+                if filter_title != "":
+                    datasets_table = datasets_table.loc[datasets_table["Title"].to_numpy() == filter_title, list(_ALL_DATASETS_COLS)]
+
+                self._print_table(datasets_table.itertuples(index=False, name=None), _ALL_DATASETS_COLS, max_rows)
+
+        except KeyError as kerr:
+            self.session.logging.error(f"Wrong or missing key '{kerr}' in response content as DataFrame!!!")
+            print(f"Wrong or missing key '{kerr}' in response content as DataFrame!!!")
+
+
+    def _get_all_datasets_table(self, 
+                                filters: dict[str, str]) -> DataFrame | None:
+        """
+            Returns the table of all existing datasets indexed by access, project and zone. 
+            The table is fetched from the server only if the cached one is older than cache_ttl.
+
+            Parameters
+            ----------
+            filters : dict[str, str]
+                Location filters ("access", "project", "zone") applied by the server. Empty values are ignored.
+
+            Returns
+            -------
+            DataFrame | None
+                Table of all datasets. None is returned if some errors have occured.
+        """
+        def load_table() -> tuple[DataFrame, int] | tuple[None, None]:
+            content, req_status = self.datasets.get_all_datasets(content_as_pandas=True, filters=filters)
+            if req_status is None:
+                return None, None
+
+            # Repeated values of the location columns are stored once as categories, the table is kept in the cache
+            datasets_table: DataFrame = content[list(_ALL_DATASETS_COLS)] \
+                                            .astype({col: "category" for col in _ALL_DATASETS_INDEX}) \
+                                            .set_index(list(_ALL_DATASETS_INDEX), drop=False) \
+                                            .sort_index()
+            return datasets_table, req_status
+
+        datasets_table, _ = self._cached(("get_all_datasets", tuple(sorted(filters.items()))), load_table)
+        
+        return datasets_table
+
+
+    def _print_table(self, 
+                     rows: Iterable[tuple], 
+                     headers: tuple[str, ...],
+                     max_rows: Optional[int]=_MAX_ROWS) -> None:
+        """
+            Prints rows as ASCII table in grid format. The table is formatted and written to stdout in pages 
+            of _TABLE_PAGE_SIZE rows, so the whole table is never held as one string. All pages share the same column 
+            widths and alignment, hence they join into a single table.
+
+            Parameters
+            ----------
+            rows : Iterable[tuple]
+                Rows of the table.
+            headers : tuple[str, ...]
+                Headers of the table.
+            max_rows : int, optional
+                If there are more rows, only the first and the last max_rows/2 rows are printed. 
+                If None, all rows are printed. By default: max_rows=100.
+
+            Returns
+            -------
+            None
+        """
+        # Making ASCII table
+        # Source: https://stackoverflow.com/questions/5909873/how-can-i-pretty-print-ascii-tables-with-python
+        from tabulate import tabulate
+
+        n_rows: int = 0
+        n_skipped: int = 0
+        if max_rows is None:
+            rows = list(rows)
+            n_rows = len(rows)
+        else:
+            # Keep only the head and the tail of the rows
+            rows = iter(rows)
+            head: list[tuple] = list(islice(rows, max_rows - max_rows // 2))
+            tail: deque[tuple] = deque(maxlen=max_rows // 2)
+            for row in rows:
+                tail.append(row)
+                n_skipped += 1
+            n_rows = len(head) + n_skipped
+            n_skipped = n_skipped - len(tail)
+            rows = head + list(tail)
+
+        is_numeric: list[bool] = [len(rows) > 0 and all(isinstance(row[i], Number) and not isinstance(row[i], bool) for row in rows) 
+                                  for i in range(len(headers))]
+        cells: list[tuple[str, ...]] = [tuple(str(cell) for cell in row) for row in rows]
+        if n_skipped > 0:
+            cells.insert(len(head), ("...",) * len(headers))
+        
+        # Headers padded to the widest cell of the column fix the width of the column in all pages
+        # (tabulate adds 2 spaces of padding to the headers)
+        widths: list[int] = [max([len(header) + 2] + [len(line) for row in cells for line in row[i].splitlines()]) - 2
+                             for i, header in enumerate(headers)]
+        padded_headers: list[str] = [header.rjust(width) if numeric else header.ljust(width) 
+                                     for header, width, numeric in zip(headers, widths, is_numeric)]
+        colalign: tuple[str, ...] = tuple("right" if numeric else "left" for numeric in is_numeric)
+
+        if len(cells) == 0:
+            sys.stdout.write(tabulate([], padded_headers, tablefmt="grid") + "\n")
+
+        for start in range(0, len(cells), _TABLE_PAGE_SIZE):
+            page: str = tabulate(cells[start:start + _TABLE_PAGE_SIZE], 
+                                 padded_headers, 
+                                 tablefmt="grid", 
+                                 colalign=colalign, 
+                                 disable_numparse=True)
+            if start > 0:
+                # Skip the top border and the header, the bottom border of the previous page separates the rows
+                page = page.split("\n", 3)[3]
+            sys.stdout.write(page + "\n")
+
+        if n_skipped > 0:
+            sys.stdout.write(f"Showing {n_rows - n_skipped} of {n_rows} rows.\n")
+        
+        sys.stdout.flush()
+
+
+    def _cached(self, 
+                key: tuple, 
+                loader: callable) -> tuple:
+        """
+            Returns the cached response of a listing request if it is younger than cache_ttl. 
+            Otherwise, the response is loaded and cached if no errors have occured.
+
+            Parameters
+            ----------
+            key : tuple
+                Name of the request and its arguments.
+            loader : callable
+                Function sending the request. Returns content and status of the request, the status is None on error.
+
+            Returns
+            -------
+            tuple
+                Content and status of the request as returned by the loader.
+        """
+        cached: tuple[float, tuple] | None = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            self.session.logging.debug("DATASETS -- %s -- CACHED -- OK", key)
+            return cached[1]
+
+        response: tuple = loader()
+        if response[1] is not None:
+            self._cache[key] = (time.monotonic(), response)
+        
+        return response
+
+
+    def invalidate(self) -> None:
+        """
+            Drops all cached responses of listing requests. It is called after each change of datasets made by this class.
+
+            Returns
+            -------
+            None
+        """
+        self._cache.clear()
 
 
     def delete_dataset_by_id(self, 
@@ -403,8 +700,38 @@ class DatasetsCLI(object):
         """
 
         _, _ = self.datasets.delete_dataset_by_id(dataset_id, access, project)
+        self.invalidate()
 
 
+    def delete_datasets_by_ids(self, 
+                               dataset_ids: list[str], 
+                               access: str, 
+                               project: str,
+                               max_workers: Optional[int]=8) -> None:
+        """
+            Deletes several datasets at once, the requests are sent concurrently.
+
+            Parameters
+            ----------
+            dataset_ids : list[str]
+                InternalIDs of the datasets. Can be obtain by get_all_datasets() method.
+            access : str
+                One of the access types [public, project, user]. Can be obtain by get_all_datasets() method.
+            project: str
+                Project's short name in which datasets are stored. Can be obtain by get_all_datasets() method.
+            max_workers : int, optional
+                Maximum number of datasets deleted concurrently. By default, max_workers=8.
+
+            Returns
+            -------
+            None
+        """
+
+        _ = self.datasets.delete_datasets_by_ids(dataset_ids, access, project, max_workers)
+        self.invalidate()
+
+
+    @_with_default_zone
     def download_dataset(self, 
                          dataset_id: str,
                          access: str,
@@ -436,12 +763,33 @@ class DatasetsCLI(object):
             ------
             None
         """
-        if zone == "":
-            zone = self.session.DFLT_Z 
-
         self.datasets.download_dataset(dataset_id, access, project, zone, path, destination_file)
         
 
+    def download_datasets(self, 
+                          datasets: list[dict],
+                          max_workers: Optional[int]=8) -> None:
+        """
+            Downloads several datasets at once. Status of all submitted downloads is checked by a single request
+            and the datasets are downloaded concurrently as soon as they are ready.
+
+            Parameters
+            ----------
+            datasets : list[dict]
+                Datasets to be downloaded. Each item holds the parameters of download_dataset() as keys, i.e. "dataset_id", "access", "project"
+                and optionally "zone", "path" and "destination_file". By default, destination_file="./DATASET_ID.tar.gz".
+            max_workers : int, optional
+                Maximum number of datasets downloaded concurrently. By default, max_workers=8.
+
+            Return
+            ------
+            None
+        """
+
+        _ = self.datasets.download_datasets(datasets, max_workers)
+
+
+    @_with_default_zone
     def get_list_of_files_in_dataset(self, 
                                      dataset_id: str, 
                                      access: str,
@@ -453,7 +801,8 @@ class DatasetsCLI(object):
                                      filename_compare_type: Optional[str]="",
                                      filter_size: Optional[int]=0,
                                      size_compare_type: Optional[str]="geq", 
-                                     filter_type: Optional[str]="") -> None:
+                                     filter_type: Optional[str]="",
+                                     max_rows: Optional[int]=_MAX_ROWS) -> None:
         """
             List all files within the dataset.
 
@@ -490,74 +839,187 @@ class DatasetsCLI(object):
                 By default: "geq".
             filter_type : str, optional
                 To filter table of files by type. By default: "" (i.e. filter is off).
+            max_rows : int, optional
+                Maximum number of printed rows. If there are more rows, only the first and the last max_rows/2 rows are printed.
+                If None, all rows are printed. By default: max_rows=100.
 
             Returns
             -------
             None
         """
-        if zone == "":
-            zone = self.session.DFLT_Z 
+        import numpy as np
+        from py4lexis.directory_tree import DirectoryTree
+        from py4lexis.custom_types.directory_tree import TreeDirectoryObject
 
-        if not print_dir_tree:
-            content, req_status = self.datasets.get_list_of_files_in_dataset(dataset_id, 
-                                                                            access,
-                                                                            project, 
-                                                                            zone, 
-                                                                            path=path,
-                                                                            content_as_pandas=True)
-        else:
-            content, req_status = self.datasets.get_list_of_files_in_dataset(dataset_id, 
-                                                                            access,
-                                                                            project, 
-                                                                            zone, 
-                                                                            path=path,
-                                                                            content_as_pandas=False)
-            
+        content, req_status = self._get_list_of_files(dataset_id, access, project, zone, path)
 
         if req_status is not None and not print_dir_tree:
-            try:
-                print(f"Formatting pandas DataFrame into ASCII table...")
-                
-                cols: list[str] = ["Filename", "Path", "Size", "CreateTime", "Checksum"]
-                datasets_table: DataFrame = content
-
+            # Filters are checked once, then applied to each chunk of the table
+            if filter_filename != "" and filename_compare_type not in ("eq", "in"):
+                print("Wrong comparison type for filename.")
+            # Size 0 means the filter is off
+            size_op: Callable[[Any, Any], Any] | None = None
+            if filter_size > 0:
+                size_op = _SIZE_OPS.get(size_compare_type)
+                if size_op is None:
+                    print("Wrong comparison type for filesize.")
+            elif filter_size < 0:
+                print("Filesize cannot be negative.")
+
+            def filter_chunk(datasets_table: DataFrame) -> Iterable[tuple]:
+                # All filters are combined into one mask applied at once
+                mask: np.ndarray = np.ones(len(datasets_table), dtype=bool)
                 if filter_filename != "":
                     if filename_compare_type == "eq":
-                        datasets_table = datasets_table[datasets_table["Filename"] == filter_filename]
+                        mask &= datasets_table["Filename"].to_numpy() == filter_filename
                     elif filename_compare_type == "in":
-                        datasets_table = datasets_table[filter_filename in datasets_table["Filename"]]
-                    else:
-                        print("Wrong comparison type for filename.")
-                if filter_size >= 0:
-                    if size_compare_type == "eq":
-                        datasets_table = datasets_table[datasets_table["Size"] == filter_size]
-                    elif size_compare_type == "l":
-                        datasets_table = datasets_table[datasets_table["Size"] < filter_size]
-                    elif size_compare_type == "leq":
-                        datasets_table = datasets_table[datasets_table["Size"] <= filter_size]
-                    elif size_compare_type == "g":
-                        datasets_table = datasets_table[datasets_table["Size"] > filter_size]
-                    elif size_compare_type == "geq":
-                        datasets_table = datasets_table[datasets_table["Size"] >= filter_size]
-                    else:
-                        print("Wrong comparison type for filesize.")
-                else:
-                    print("Filesize cannot be negative.")
+                        mask &= datasets_table["Filename"].str.contains(filter_filename, regex=False, na=False).to_numpy(dtype=bool)
+                if size_op is not None:
+                    mask &= size_op(datasets_table["Size"].to_numpy(), filter_size)
 
                 if filter_type != "":
-                    datasets_table = datasets_table[datasets_table["Type"] == filter_type]
+                    mask &= datasets_table["Type"].to_numpy() == filter_type
+
+                # Rows and columns are selected at once, without intermediate tables
+                return datasets_table.loc[mask, list(_LIST_OF_FILES_COLS)].itertuples(index=False, name=None)
 
-                print(tabulate(datasets_table.values.tolist(), cols, tablefmt="grid"))
+            try:
+                print(f"Formatting pandas DataFrame into ASCII table...")
+
+                # Chunks are filtered while printing, so only one chunk of the table is held at once.
+                # The listing fetched above is chunked, so it is not requested again.
+                chunks: Generator[DataFrame, None, None] = self._iter_file_chunks(content, _FILES_CHUNK_SIZE)
+                self._print_table(chain.from_iterable(filter_chunk(chunk) for chunk in chunks), _LIST_OF_FILES_COLS, max_rows)
 
             except KeyError as kerr:
                 self.session.logging.error(f"Wrong or missing key '{kerr}' in response content as DataFrame!!!")
                 print(f"Wrong or missing key '{kerr}' in response content as DataFrame!!!")
 
         if req_status is not None and print_dir_tree:
-            tree_content: TreeDirectoryObject = TreeDirectoryObject(content)
+            tree_content: TreeDirectoryObject = TreeDirectoryObject.from_dict(content)
             tree_items: Generator[DirectoryTree, None, None] = DirectoryTree.make_tree(tree_content)
-            for item in tree_items:
-                print(item.to_string())
+            buffer: io.StringIO = io.StringIO()
+            for i, item in enumerate(tree_items, start=1):
+                buffer.write(item.to_string())
+                buffer.write("\n")
+                if i % _TREE_FLUSH_LINES == 0:
+                    sys.stdout.write(buffer.getvalue())
+                    buffer.seek(0)
+                    buffer.truncate()
+
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+
+
+    @_with_default_zone
+    def iter_files(self, 
+                   dataset_id: str, 
+                   access: str,
+                   project: str, 
+                   zone: Optional[str]="",
+                   path: Optional[str]="",
+                   chunk_size: Optional[int]=_FILES_CHUNK_SIZE) -> Generator[DataFrame, None, None]:
+        """
+            Yields the table of files within the dataset in chunks of chunk_size rows. Each chunk is built only when it is requested,
+            so the table of a large dataset is never held in memory at once.
+
+            Parameters
+            ----------
+            dataset_id : str
+                InternalID of the dataset. Can be obtain by get_all_datasets() method.
+            access : str
+                Access of the dataset. One of ["user", "project", "public"]. Can be obtain by get_all_datasets() method.
+            project : str
+                Project's short name in which the dataset is stored. Can be obtain by get_all_datasets() method.
+            zone: str, optional
+                iRODS zone name in which dataset is stored. By default: zone of the session.
+            path : str, optional
+                Path within the dataset. By default: path="".
+            chunk_size : int, optional
+                Maximum number of rows of each yielded table. By default: chunk_size=10000.
+
+            Returns
+            -------
+            Generator[DataFrame, None, None]
+                Tables of files with columns "Filename", "Path", "Size", "CreateTime", "Checksum". 
+                Nothing is yielded if some errors have occured.
+        """
+        content, req_status = self._get_list_of_files(dataset_id, access, project, zone, path)
+        if req_status is None:
+            return
+
+        yield from self._iter_file_chunks(content, chunk_size)
+
+
+    def _iter_file_chunks(self, 
+                          content: dict, 
+                          chunk_size: int) -> Generator[DataFrame, None, None]:
+        """
+            Yields the table of files from the listing in chunks of chunk_size rows.
+
+            Parameters
+            ----------
+            content : dict
+                Listing of files as JSON obtained by _get_list_of_files().
+            chunk_size : int
+                Maximum number of rows of each yielded table.
+
+            Returns
+            -------
+            Generator[DataFrame, None, None]
+                Tables of files with columns "Filename", "Path", "Size", "CreateTime", "Checksum".
+        """
+        from pandas import DataFrame
+        from py4lexis.directory_tree import DirectoryTree
+        from py4lexis.custom_types.directory_tree import TreeDirectoryObject
+
+        # Rows of files, directories give None and are dropped. Nodes are converted by map() and filter() without a Python-level loop.
+        files: Iterator[list[str | int]] = filter(None, map(DirectoryTree.to_dataframe_row, 
+                                                            DirectoryTree.make_tree(TreeDirectoryObject.from_dict(content))))
+        while True:
+            chunk: list[list[str | int]] = list(islice(files, chunk_size))
+            if len(chunk) == 0:
+                break
+            yield DataFrame.from_records(chunk, columns=list(_LIST_OF_FILES_COLS))
+
+
+    def _get_list_of_files(self, 
+                           dataset_id: str, 
+                           access: str,
+                           project: str, 
+                           zone: str,
+                           path: str) -> tuple[dict, int] | tuple[None, None]:
+        """
+            Returns the raw JSON listing of files within the dataset. The listing is fetched from the server 
+            only if the cached one is older than cache_ttl, so the table and the directory tree share it.
+
+            Parameters
+            ----------
+            dataset_id : str
+                InternalID of the dataset.
+            access : str
+                Access of the dataset.
+            project : str
+                Project's short name in which the dataset is stored.
+            zone: str
+                iRODS zone name in which dataset is stored.
+            path : str
+                Path within the dataset.
+
+            Returns
+            -------
+            dict | None
+                Listing of files as JSON. None is returned if some errors have occured.
+            int | None
+                Status of the HTTP request. None is returned if some errors have occured.
+        """
+        return self._cached(("get_list_of_files_in_dataset", dataset_id, access, project, zone, path),
+                            lambda: self.datasets.get_list_of_files_in_dataset(dataset_id, 
+                                                                               access,
+                                                                               project, 
+                                                                               zone, 
+                                                                               path=path,
+                                                                               content_as_pandas=False))
 
 
     def get_dataset_path(self, access: str, project: str, internalID: str, username: Optional[str]=""):
@@ -581,4 +1043,4 @@ class DatasetsCLI(object):
 
         """
 
-        print(f"Path: {self.datasets.get_dataset_path(access, project, internalID, username)}")
\ No newline at end of file
+        sys.stdout.write(f"Path: {self.datasets.get_dataset_path(access, project, internalID, username)}\n")
\ No newline at end of file
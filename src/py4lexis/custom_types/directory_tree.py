@@ -1,7 +1,10 @@
 from __future__ import annotations
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, ClassVar, Generator
+import sys
 
 
+@dataclass(slots=True)
 class TreeDirectoryObject(object):
     """
         Class which holds the directory returned in HTTP content
@@ -9,33 +12,67 @@ class TreeDirectoryObject(object):
 
         Attributes
         ----------
-        directory: dict
-            Directory as dictionary returned in the content of HTTP request in the function
+        contents: list[dict]
+            Items of the directory as returned in the content of HTTP request in the function
             py4lexis.ddi.get_list_of_files_in_dataset().
+        name: str
+            Name of the directory followed by "/".
+        type: str
+            Type of the object, i.e. "directory".
+        is_dir: bool, in_class
+            As the class is a directory, it is True.
 
         Methods
         -------
-        is_dir() -> bool
-            Returns if the object is directory or not.
+        from_dict(directory: dict) -> TreeDirectoryObject
+            Creates the object from the directory as dictionary returned in the content of HTTP request.
+
+        iter_items() -> Generator[TreeDirectoryObject | TreeFileObject, None, None]
+            Yields the items of the directory as objects.
     """
+    is_dir: ClassVar[bool] = True
+
+    contents: list[dict]
+    name: str
+    type: str = "directory"
 
-    def __init__(self, directory: dict) -> None:
-        self.contents: list[dict] = directory["contents"]
-        self.type: str = "directory"
-        
-        if "name" in directory.keys():
-            self.name: int = directory["name"] + "/"
-        else:
-            self.name: str = str("UKNOWN_dir/")
-    
     @classmethod
-    def is_dir(cls) -> bool:
+    def from_dict(cls, directory: dict) -> TreeDirectoryObject:
+        """
+            Creates the object from the directory as dictionary returned in the content of HTTP request.
+
+            Parameters
+            ----------
+            directory: dict
+                Directory as dictionary returned in the content of HTTP request in the function
+                py4lexis.ddi.get_list_of_files_in_dataset().
+
+            Returns
+            -------
+            TreeDirectoryObject
+                The directory object.
         """
-            As the class is a directory, it returns True.
+        # Names of directories repeat across the tree (and the listings), they are interned to be stored once
+        return cls(directory["contents"], sys.intern(directory.get("name", "UKNOWN_dir") + "/"))
+
+    def iter_items(self) -> Generator[TreeDirectoryObject | TreeFileObject, None, None]:
         """
-        return True
+            Yields the items of the directory as objects. Each object is created only when it is reached,
+            so the objects of all items are never held together with the contents.
 
+            Returns
+            -------
+            Generator[TreeDirectoryObject | TreeFileObject, None, None]
+                Items of the directory.
+        """
+        for item in self.contents:
+            if item["type"] == "directory":
+                yield TreeDirectoryObject.from_dict(item)
+            else:
+                yield TreeFileObject.from_dict(item)
 
+
+@dataclass(slots=True)
 class TreeFileObject(object):
     """
         Class which holds the file returned in HTTP content
@@ -43,45 +80,54 @@ class TreeFileObject(object):
 
         Attributes
         ----------
-        file: dict
-            File as dictionary returned in the content of HTTP request in the function
-            py4lexis.ddi.get_list_of_files_in_dataset().
+        checksum: Any
+            Checksum of the file. "None" if the file has no checksum.
+        create_time: str
+            Creation time of the file.
+        size: int | str
+            Size of the file.
+        name: str
+            Name of the file.
+        type: str
+            Type of the object, i.e. "file".
+        is_dir: bool, in_class
+            As the class is NOT a directory, it is False.
 
         Methods
         -------
-        is_dir() -> bool
-            Returns if the object is directory or not.
+        from_dict(file: dict) -> TreeFileObject
+            Creates the object from the file as dictionary returned in the content of HTTP request.
     """
+    is_dir: ClassVar[bool] = False
+
+    checksum: Any
+    create_time: str
+    size: int | str
+    name: str
+    type: str = "file"
 
-    def __init__(self, file: dict) -> None:
-        if "checksum" in file.keys():
-            if file["checksum"] is None:
-                self.checksum: str = "None"  
-            else:
-                self.checksum: Any = file["checksum"] 
-        else:
-            self.checksum: str = str("UKNOWN Checksum")
-        
-        if "create_time" in file.keys():
-            self.create_time: str = file["create_time"]  
-        else:
-            self.create_time: str = str("UKNOWN Create Time")
-
-        if "size" in file.keys():
-            self.size: int = file["size"]
-        else:
-            self.size: str = str("UKNOWN size")
-
-        if "name" in file.keys():
-            self.name: int = file["name"]
-        else:
-            self.name: str = str("UKNOWN name")
-
-        self.type: str = "file",
-        
     @classmethod
-    def is_dir(cls) -> bool:
+    def from_dict(cls, file: dict) -> TreeFileObject:
         """
-            As the class is NOT a directory, it returns False.
+            Creates the object from the file as dictionary returned in the content of HTTP request.
+            Missing values are replaced by "UKNOWN ..." strings.
+
+            Parameters
+            ----------
+            file: dict
+                File as dictionary returned in the content of HTTP request in the function
+                py4lexis.ddi.get_list_of_files_in_dataset().
+
+            Returns
+            -------
+            TreeFileObject
+                The file object.
         """
-        return False
\ No newline at end of file
+        checksum: Any = file.get("checksum", "UKNOWN Checksum")
+        if checksum is None:
+            checksum = "None"
+
+        return cls(checksum,
+                   file.get("create_time", "UKNOWN Create Time"),
+                   file.get("size", "UKNOWN size"),
+                   file.get("name", "UKNOWN name"))
\ No newline at end of file
@@ -1,27 +1,70 @@
 from __future__ import annotations
 import hashlib
-from typing import Optional
-import requests as req
+from typing import TYPE_CHECKING, BinaryIO, Callable, Optional
 from requests import Response
-from datetime import date, datetime
+from requests.exceptions import RequestException
 from py4lexis.ddi.tus_client import TusClient
+from py4lexis.ddi.download_cache import DownloadCache
 from tusclient import exceptions
-from pandas import DataFrame
 from py4lexis.exceptions import Py4LexisException
 from py4lexis.session import LexisSession
 from py4lexis.utils import convert_get_all_datasets_to_pandas, \
                            convert_get_datasets_status_to_pandas, \
-                           convert_dir_tree_to_pandas, printProgressBar
+                           convert_dir_tree_to_pandas, printProgressBar, \
+                           get_current_year, get_default_title
 from py4lexis.ddi.uploader import Uploader
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from urllib3.exceptions import HTTPError
+import asyncio
+import base64
 import json
+import os
+import random
+import shutil
 import time
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+# Default metadata of a new dataset
+_DEFAULT_CONTRIBUTOR: tuple[str, ...] = ("UNKNOWN contributor",)
+_DEFAULT_CREATOR: tuple[str, ...] = ("UNKNOWN creator",)
+_DEFAULT_OWNER: tuple[str, ...] = ("UNKNOWN owner",)
+_DEFAULT_PUBLISHER: tuple[str, ...] = ("UNKNOWN publisher",)
+_DEFAULT_RESOURCE_TYPE: str = "UNKNOWN resource type"
+
+# Download statuses fetched within this time are reused
+_DOWNLOAD_STATUS_TTL: float = 1.0 # secs
+_DOWNLOAD_STATUS_CACHE_SIZE: int = 1024
+# Download states after which the status does not change anymore
+_DOWNLOAD_TERMINAL_STATES: tuple[str, ...] = ("SUCCESS", "ERROR", "FAILURE")
+# Waiting for a download request to be ready, the status is checked with exponential backoff
+_DOWNLOAD_POLL_INITIAL_DELAY: float = 1.0 # secs
+_DOWNLOAD_POLL_MAX_DELAY: float = 30.0 # secs
+_DOWNLOAD_MAX_WAIT: float = 1000.0 # secs
+# Requests repeated after the token was refreshed
+_POLL_MAX_ATTEMPTS: int = 5
+# Bounds of the TUS chunk size chosen by the size of the uploaded file
+_TUS_MIN_CHUNK_SIZE: int = 8 * 1024 * 1024 # bytes
+_TUS_MAX_CHUNK_SIZE: int = 64 * 1024 * 1024 # bytes
+# Downloads at least this large are split into concurrent range requests if the server supports them
+_RANGED_DOWNLOAD_MIN_SIZE: int = 64 * 1024 * 1024 # bytes
+_RANGED_DOWNLOAD_PARTS: int = 4
+# Interrupted download is resumed from the received bytes at most this many times
+_DOWNLOAD_MAX_RESUMES: int = 3
+
+# Progress of the download is reported at most this often
+_PROGRESS_REPORT_INTERVAL: float = 0.05 # secs
+
 
 class Datasets(object):
     def __init__(self,
                  session: LexisSession,
                  print_content: Optional[bool]=False,
-                 suppress_print: Optional[bool]=True) -> None:
+                 suppress_print: Optional[bool]=True,
+                 use_download_cache: Optional[bool]=False) -> None:
         """
             A class holds methods to manage datasets within LEXIS platform.
 
@@ -33,6 +76,9 @@ class Datasets(object):
                 If True then contents of all requests will be printed.
             suppress_print: bool, optional
                 If True then all prints are suppressed. By default: suppress_print=True
+            use_download_cache: bool, optional
+                If True then downloaded datasets are kept in a local cache (see DownloadCache) and reused by download_dataset() 
+                while their files have not changed. By default: use_download_cache=False
 
             Methods
             -------
@@ -41,13 +87,13 @@ class Datasets(object):
                            push_method: Optional[str]="empty", 
                            zone: Optional[str]="IT4ILexisZone",
                            path: Optional[str]="", 
-                           contributor: Optional[list[str]]=["UNKNOWN contributor"], 
-                           creator: Optional[list[str]]=["UNKNOWN creator"],
-                           owner: Optional[list[str]]=["UNKNOWN owner"], 
-                           publicationYear: Optional[str]=str(date.today().year),
-                           publisher: Optional[list[str]]=["UNKNOWN publisher"], 
-                           resourceType: Optional[str]=str("UNKNOWN resource type"),
-                           title: Optional[str]=str("UNTITLED_Dataset_" + datetime.now().strftime("%d-%m-%Y_%H:%M:%S"))) -> tuple[dict, int] | tuple[None, None]
+                           contributor: Optional[tuple[str, ...]]=("UNKNOWN contributor",), 
+                           creator: Optional[tuple[str, ...]]=("UNKNOWN creator",),
+                           owner: Optional[tuple[str, ...]]=("UNKNOWN owner",), 
+                           publicationYear: Optional[str]=None,
+                           publisher: Optional[tuple[str, ...]]=("UNKNOWN publisher",), 
+                           resourceType: Optional[str]="UNKNOWN resource type",
+                           title: Optional[str]=None) -> tuple[dict, int] | tuple[None, None]
                 Create an empty dataset with specified attributes.
 
             tus_uploader_new(access: str, 
@@ -56,15 +102,17 @@ class Datasets(object):
                              zone: Optional[str]="IT4ILexisZone", 
                              file_path: Optional[str]="./",
                              path: Optional[str]="", 
-                             contributor: Optional[list[str]]=["NONAME contributor"], 
-                             creator: Optional[list[str]]=["NONAME creator"],
-                             owner: Optional[list[str]]=["NONAME owner"], 
-                             publicationYear: Optional[str]=str(date.today().year), 
-                             publisher: Optional[list[str]]=["NONAME publisher"],
-                             resourceType: Optional[str]="NONAME resource type", 
-                             title: Optional[str]="UNTITLED_TUS_Dataset_" + datetime.now().strftime("%d-%m-%Y_%H:%M:%S"), 
+                             contributor: Optional[tuple[str, ...]]=("UNKNOWN contributor",), 
+                             creator: Optional[tuple[str, ...]]=("UNKNOWN creator",),
+                             owner: Optional[tuple[str, ...]]=("UNKNOWN owner",), 
+                             publicationYear: Optional[str]=None, 
+                             publisher: Optional[tuple[str, ...]]=("UNKNOWN publisher",),
+                             resourceType: Optional[tuple[str, ...]]=("UNKNOWN resource type",), 
+                             title: Optional[str]=None, 
                              expand: Optional[str]="no", 
-                             encryption: Optional[str]="no") -> None
+                             encryption: Optional[str]="no",
+                             max_workers: Optional[int]=8,
+                             chunk_size: Optional[int]=None) -> None
                 Creates a new dataset with specified metadata and upload a file or whole directory tree to it.
 
             tus_uploader_rewrite(dataset_id: str,
@@ -75,31 +123,61 @@ class Datasets(object):
                                  zone: Optional[str]="IT4ILexisZone", 
                                  file_path: Optional[str]="./",
                                  path: Optional[str]="",                               
-                                 encryption: Optional[str]="no") -> None:
+                                 encryption: Optional[str]="no",
+                                 max_workers: Optional[int]=8,
+                                 chunk_size: Optional[int]=None) -> None:
                 Uploads a file or whole directory tree to existing dataset. If files already exist, it will rewrite them.
                 An archive .tar.gz could be uploaded or the "pure" files.
 
             get_dataset_status(content_as_pandas: Optional[bool]=False) -> tuple[list[dict] | DataFrame, int] | tuple[None, None]:
                 Prints a table of the datasets' staging states.
 
-            get_all_datasets(content_as_pandas: Optional[bool]=False) -> tuple[list[dict] | DataFrame, int] | tuple[None, None]:
-                Prints a table of the all existing datasets.
+            get_all_datasets(content_as_pandas: Optional[bool]=False, 
+                             filters: Optional[dict[str, str]]=None) -> tuple[list[dict] | DataFrame, int] | tuple[None, None]:
+                Prints a table of the all existing datasets. Datasets can be filtered by the server.
+
+            get_dataset_by_id(dataset_id: str, 
+                              content_as_pandas: Optional[bool]=False) -> tuple[list[dict] | DataFrame, int] | tuple[None, None]:
+                Returns the dataset with specified InternalID without listing all existing datasets.
 
             delete_dataset_by_id(dataset_id: str, 
                                  access: str, 
                                  project: str) -> tuple[list[dict], int] | tuple[None, None]
                 Deletes a dataset by a specified internalID.
 
+            delete_datasets_by_ids(dataset_ids: list[str], 
+                                   access: str, 
+                                   project: str,
+                                   max_workers: Optional[int]=8) -> list[bool]
+                Deletes several datasets at once, the requests are sent concurrently.
+
             download_dataset(acccess: str, 
                              project: str, 
                              dataset_id: str, 
                              zone: Optional[str]="IT4ILexisZone",
                              path: Optional[str]="",
-                             destination_file: Optional[str]="./download.tar.gz") -> None
+                             destination_file: Optional[str]="./download.tar.gz",
+                             checksum: Optional[str]=None) -> None
                 Downloads dataset by a specified informtions as access, zone, project, Interna_Id.
                 It is possible to specify by path parameter which exact file in the dataset should be downloaded.
                 It is popsible to specify local desination folder. Default is set to = "./download.tar.gz"
 
+            download_dataset_async(dataset_id: str,
+                                   access: str, 
+                                   project: str,                           
+                                   zone: Optional[str]="",
+                                   path: Optional[str]="",
+                                   destination_file: Optional[str]="./download.tar.gz",
+                                   checksum: Optional[str]=None) -> bool
+                Asynchronous variant of download_dataset(), several downloads can be awaited together.
+
+            download_datasets(datasets: list[dict], max_workers: Optional[int]=8) -> list[bool]
+                Downloads several datasets at once. Status of all submitted downloads is checked by a single request 
+                and the datasets are downloaded concurrently.
+
+            get_download_statuses(request_ids: list[str]) -> dict[str, dict] | None
+                Returns download status of several download requests by a single request.
+
             get_list_of_files_in_dataset(dataset_id: str, 
                                          access: str,
                                          project: str, 
@@ -114,6 +192,96 @@ class Datasets(object):
         self.session = session
         self.print_content = print_content
         self.suppress_print = suppress_print
+        # Default zone of the session, used when no zone is given
+        self._default_zone: str = session.DFLT_Z
+        self._download_status_cache: dict[str, tuple[float, dict]] = {}
+        self.download_cache: DownloadCache | None = DownloadCache() if use_download_cache else None
+        # TUS client shared by all uploads, its chunks are sent through the pooled HTTP session
+        self._tus_client: TusClient = TusClient(session.API_PATH + "/transfer/upload/", http=session.http)
+        # URLs of the DDI API endpoints, the API path does not change during the session
+        self._dataset_url: str = session.API_PATH + "/dataset"
+        self._search_url: str = session.API_PATH + "/dataset/search/metadata"
+        self._listing_url: str = session.API_PATH + "/dataset/listing"
+        self._status_url: str = session.API_PATH + "/transfer/status"
+        self._download_url: str = session.API_PATH + "/transfer/download"
+
+
+    def _json_request(self, method: str, url: str, body: dict) -> Callable[[], Response]:
+        """
+            Returns a function sending the request with the JSON body, e.g. for _poll(). The body is serialized once, 
+            so it is not encoded again if the request is repeated.
+
+            Parameters
+            ----------
+            method : str
+                HTTP method of the request.
+            url : str
+                URL of the request.
+            body : dict
+                Body of the request.
+
+            Returns
+            -------
+            Callable[[], Response]
+                Function which sends the request and returns its response.
+        """
+        data: bytes = json.dumps(body).encode()
+
+        # The header is looked up on each call as it changes when the token is refreshed
+        return lambda: self.session.http.request(method, 
+                                                 url, 
+                                                 headers={**self.session.API_HEADER, "Content-type": "application/json"}, 
+                                                 data=data)
+
+
+    def _poll(self, 
+              request_fn: Callable[[], Response], 
+              log_msg: str, 
+              to_json: Optional[bool]=True,
+              stream: Optional[bool]=False) -> tuple[Response, dict | bytes, bool]:
+        """
+            Sends the request until its status is solved, i.e. it is repeated right after the token was refreshed. The number 
+            of attempts is limited by _POLL_MAX_ATTEMPTS. Transient server and network failures are retried with backoff 
+            (respecting Retry-After) by the session itself.
+
+            Parameters
+            ----------
+            request_fn : Callable[[], Response]
+                Function which sends the request and returns its response.
+            log_msg : str
+                Message for the logger.
+            to_json : bool, optional
+                Convert content of response to JSON. By default is set to True.
+            stream : bool, optional
+                If True, the content of a successful response is not read. By default is set to False.
+
+            Returns
+            -------
+            Response
+                The last response.
+            dict | bytes
+                Content of the response.
+            bool
+                is_error: If True, some errors have occured.
+        """
+        for attempt in range(1, _POLL_MAX_ATTEMPTS + 1):
+            response: Response = request_fn()
+            content, status_solved, is_error = self.session.handle_request_status(response, 
+                                                                                  log_msg, 
+                                                                                  to_json=to_json,
+                                                                                  suppress_print=self.suppress_print,
+                                                                                  stream=stream)
+            if status_solved or is_error:
+                return response, content, is_error
+
+            # Token was refreshed, so the request is repeated without waiting
+            response.close()
+
+        self.session.logging.error(f"{log_msg} -- Reached maximum attempts: {_POLL_MAX_ATTEMPTS} -- FAILED")
+        if not self.suppress_print:
+            print(f"{log_msg} -- Reached maximum attempts: {_POLL_MAX_ATTEMPTS} -- FAILED")
+
+        return response, content, True
 
 
     def create_dataset(self, 
@@ -122,13 +290,13 @@ class Datasets(object):
                        push_method: Optional[str]="empty", 
                        zone: Optional[str]="",
                        path: Optional[str]="", 
-                       contributor: Optional[list[str]]=["UNKNOWN contributor"], 
-                       creator: Optional[list[str]]=["UNKNOWN creator"],
-                       owner: Optional[list[str]]=["UNKNOWN owner"], 
-                       publicationYear: Optional[str]=str(date.today().year),
-                       publisher: Optional[list[str]]=["UNKNOWN publisher"], 
-                       resourceType: Optional[str]=str("UNKNOWN resource type"),
-                       title: Optional[str]=str("UNTITLED_Dataset_" + datetime.now().strftime("%d-%m-%Y_%H:%M:%S"))) -> tuple[dict, int] | tuple[None, None]:
+                       contributor: Optional[tuple[str, ...]]=_DEFAULT_CONTRIBUTOR, 
+                       creator: Optional[tuple[str, ...]]=_DEFAULT_CREATOR,
+                       owner: Optional[tuple[str, ...]]=_DEFAULT_OWNER, 
+                       publicationYear: Optional[str]=None,
+                       publisher: Optional[tuple[str, ...]]=_DEFAULT_PUBLISHER, 
+                       resourceType: Optional[str]=_DEFAULT_RESOURCE_TYPE,
+                       title: Optional[str]=None) -> tuple[dict, int] | tuple[None, None]:
         """
             Creates an empty dataset with specified attributes
 
@@ -144,16 +312,16 @@ class Datasets(object):
                 iRODS zone name in which dataset will be stored, one of ["IT4ILexisZone", "LRZLexisZone"]. By default: "IT4ILexisZone".
             path: str, optional
                 By default: "./"
-            contributor: list[str], optional
-                By default: ["UNKNOWN contributor"].
-            creator: list[str], optional
-                By default: ["UNKNOWN creator"].
-            owner: list[str], optional
-                By default: ["UNKNOWN owner"].
+            contributor: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN contributor",).
+            creator: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN creator",).
+            owner: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN owner",).
             publicationYear: str, optional
                 By default: CURRENT_YEAR.
-            publisher: list[str], optional
-                By default: ["UNKNOWN publisher"].
+            publisher: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN publisher",).
             resourceType: str, optional
                 By default: "UNKNOWN resource type".
             title: str, optional
@@ -166,10 +334,15 @@ class Datasets(object):
             int | None
                 Status of the HTTP request. None is returned if some errors have occured.
         """
-        if zone == "":
-            zone = self.session.DFLT_Z
+        zone = zone or self._default_zone
+
+        if publicationYear is None:
+            publicationYear = get_current_year()
+
+        if title is None:
+            title = get_default_title("UNTITLED_Dataset_")
 
-        url: str = self.session.API_PATH + "/dataset"
+        url: str = self._dataset_url
         post_body: dict = {
             "push_method": push_method,
             "access": access,
@@ -177,18 +350,17 @@ class Datasets(object):
             "zone": zone,
             "path": path,
             "metadata": {
-                "contributor": contributor,
-                "creator": creator,
-                "owner": owner,
+                "contributor": list(contributor),
+                "creator": list(creator),
+                "owner": list(owner),
                 "publicationYear": publicationYear,
-                "publisher": publisher,
+                "publisher": list(publisher),
                 "resourceType": resourceType,
                 "title": title
             }
         }
 
-        self.session.logging.debug(f"POST -- {url} -- CREATE -- PROGRESS")
-        status_solved: bool = False
+        self.session.logging.debug("POST -- %s -- CREATE -- PROGRESS", url)
         content: dict = {}
         is_error: bool = False
 
@@ -200,16 +372,9 @@ class Datasets(object):
                   f"    push_method:{push_method}\n"+
                   f"    zone:{zone}")
 
-        while not status_solved:
-            response: Response = req.post(
-                    self.session.API_PATH + "/dataset",
-                    headers=self.session.API_HEADER,
-                    json=post_body)
-            
-            content, status_solved, is_error = self.session.handle_request_status(response,
-                                                                                  f"POST -- {url} -- CREATE", 
-                                                                                  to_json=True,
-                                                                                  suppress_print=self.suppress_print)  
+        response, content, is_error = self._poll(self._json_request("POST", url, post_body),
+                                                 f"POST -- {url} -- CREATE",
+                                                 to_json=True)
 
         if is_error:
             if not self.suppress_print:
@@ -232,16 +397,20 @@ class Datasets(object):
                          zone: Optional[str]="", 
                          file_path: Optional[str]="./",
                          path: Optional[str]="", 
-                         contributor: Optional[list[str]]=["UNKNOWN contributor"], 
-                         creator: Optional[list[str]]=["UNKNOWN creator"],
-                         owner: Optional[list[str]]=["UNKNOWN owner"], 
-                         publicationYear: Optional[list[str]]=[str(date.today().year)], 
-                         publisher: Optional[list[str]]=["UNKNOWN publisher"],
-                         resourceType: Optional[list[str]]=["NONAME resource type"], 
-                         title: Optional[list[str]]=["UNTITLED_TUS_Dataset_" + datetime.now().strftime("%d-%m-%Y_%H:%M:%S")], 
-                         encryption: Optional[str]="no") -> None:
+                         contributor: Optional[tuple[str, ...]]=_DEFAULT_CONTRIBUTOR, 
+                         creator: Optional[tuple[str, ...]]=_DEFAULT_CREATOR,
+                         owner: Optional[tuple[str, ...]]=_DEFAULT_OWNER, 
+                         publicationYear: Optional[list[str]]=None, 
+                         publisher: Optional[tuple[str, ...]]=_DEFAULT_PUBLISHER,
+                         resourceType: Optional[tuple[str, ...]]=(_DEFAULT_RESOURCE_TYPE,), 
+                         title: Optional[list[str]]=None, 
+                         encryption: Optional[str]="no",
+                         max_workers: Optional[int]=8,
+                         chunk_size: Optional[int]=None) -> None:
         """
             Creates a new dataset with specified metadata and upload a file or whole directory tree to it.
+            If filename is a directory, an empty dataset is created first and the files of the directory tree are uploaded 
+            into it concurrently.
 
             Parameters
             ----------
@@ -257,35 +426,77 @@ class Datasets(object):
                 Path to a file in user's machine. By default "./".
             path: str, optional
                 By default, root path is set, i.e. "./".
-            contributor: list[str], optional
-                By default: ["UNKNOWN contributor"].
-            creator: list[str], optional
-                By default: ["UNKNOWN creator"].
-            owner: list[str], optional
-                By default: ["UNKNOWN owner"].
+            contributor: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN contributor",).
+            creator: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN creator",).
+            owner: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN owner",).
             publicationYear: list[str], optional
                 By default: [CURRENT_YEAR].
-            publisher: list[str], optional
-                By default: ["UNKNOWN publisher"].
-            resourceType: list[str], optional
-                By default: ["UNKNOWN resource type"].
+            publisher: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN publisher",).
+            resourceType: tuple[str, ...] | list[str], optional
+                By default: ("UNKNOWN resource type",).
             title: list[str], optional
                 By default: ["UNTITLED_Dataset_" + TIMESTAMP].
             encryption: str, optional
                 By default: "no".
+            max_workers: int, optional
+                Maximum number of files uploaded concurrently if filename is a directory. By default: max_workers=8.
+            chunk_size: int, optional
+                Size of the chunks sent by TUS in bytes. By default, it is chosen for each file as 1/200 of its size,
+                but at least 8 MiB and at most 64 MiB.
 
             Returns
             -------
             None
         """
-        if zone == "":
-            zone = self.session.DFLT_Z
+        zone = zone or self._default_zone
+
+        if publicationYear is None:
+            publicationYear = [get_current_year()]
+
+        if title is None:
+            title = [get_default_title("UNTITLED_TUS_Dataset_")]
 
         expand: str = "no"
         if ".tar.gz" in file_path:
             expand = "yes"
 
         file_path = file_path + filename
+        if os.path.isdir(file_path):
+            # create_dataset() takes single values of publicationYear, resourceType and title
+            content, _ = self.create_dataset(access, 
+                                             project, 
+                                             push_method="empty", 
+                                             zone=zone, 
+                                             path=path, 
+                                             contributor=contributor, 
+                                             creator=creator, 
+                                             owner=owner, 
+                                             publicationYear=publicationYear if isinstance(publicationYear, str) else publicationYear[0], 
+                                             publisher=publisher, 
+                                             resourceType=resourceType if isinstance(resourceType, str) else resourceType[0], 
+                                             title=title if isinstance(title, str) else title[0])
+            if content is None:
+                return
+            
+            metadata: dict = {
+                "project": project,
+                "access": access,
+                "zone": zone,
+                "metadata": json.dumps({
+                    "title": title
+                }),
+                "encryption": encryption,
+                "expand": "no",
+                "path": path,
+                "dataset_id": content["internalID"]
+            }
+            self._tus_upload_directory(file_path, metadata, max_workers, chunk_size)
+            return
+
         metadata: dict = {
             "path": path,
             "zone": zone,
@@ -296,17 +507,17 @@ class Datasets(object):
             "expand": expand,
             "encryption": encryption,
             "metadata": json.dumps({
-                "contributor": contributor,
-                "creator": creator,
-                "owner": owner,
+                "contributor": list(contributor),
+                "creator": list(creator),
+                "owner": list(owner),
                 "publicationYear": publicationYear,
-                "publisher": publisher,
-                "resourceType": resourceType,
+                "publisher": list(publisher),
+                "resourceType": list(resourceType),
                 "title": title
             })
         }
 
-        self._tus_upload(file_path, metadata)
+        self._tus_upload(file_path, metadata, chunk_size)
 
 
     def tus_uploader_rewrite(self, 
@@ -318,10 +529,12 @@ class Datasets(object):
                              zone: Optional[str]="", 
                              file_path: Optional[str]="./",
                              path: Optional[str]="",                               
-                             encryption: Optional[str]="no") -> None:
+                             encryption: Optional[str]="no",
+                             max_workers: Optional[int]=8,
+                             chunk_size: Optional[int]=None) -> None:
         """
             Uploads a file or whole directory tree to existing dataset. If files already exist, it will rewrite them.
-            An archive .tar.gz could be uploaded or the "pure" files.
+            An archive .tar.gz could be uploaded or the "pure" files. Files of a directory tree are uploaded concurrently.
 
             Parameters
             ----------
@@ -343,13 +556,17 @@ class Datasets(object):
                 By default, root path is set, i.e. "./".
             encryption: str, optional
                 By default: "no".
+            max_workers: int, optional
+                Maximum number of files uploaded concurrently if filename is a directory. By default: max_workers=8.
+            chunk_size: int, optional
+                Size of the chunks sent by TUS in bytes. By default, it is chosen for each file as 1/200 of its size,
+                but at least 8 MiB and at most 64 MiB.
 
             Returns
             -------
             None
         """
-        if zone == "":
-            zone = self.session.DFLT_Z
+        zone = zone or self._default_zone
 
         file_path = file_path + filename
 
@@ -371,34 +588,86 @@ class Datasets(object):
             "dataset_id": dataset_id
         }
 
-        self._tus_upload(file_path, metadata)
+        if os.path.isdir(file_path):
+            metadata["expand"] = "no"
+            self._tus_upload_directory(file_path, metadata, max_workers, chunk_size)
+        else:
+            self._tus_upload(file_path, metadata, chunk_size)
 
 
-    def _tus_upload(self, file_path: str, metadata: dict):
+    def _tus_upload_directory(self, dir_path: str, metadata: dict, max_workers: int, chunk_size: Optional[int]=None) -> None:
+        """
+            Uploads all files of the directory tree into the existing dataset given by metadata["dataset_id"]. 
+            Each file is uploaded by its own TUS upload, up to max_workers of them run concurrently.
+
+            Parameters
+            ----------
+            dir_path : str
+                Path to the directory in user's machine.
+            metadata : dict
+                TUS metadata of the upload into the existing dataset. Filename and path are set for each file.
+            max_workers : int
+                Maximum number of files uploaded concurrently.
+            chunk_size : int, optional
+                Size of the chunks sent by TUS in bytes. By default, it is chosen for each file by its size.
+
+            Returns
+            -------
+            None
+        """
+        root: str = metadata["path"]
+        if root != "" and not root.endswith("/"):
+            root = root + "/"
+
+        # Files are collected by iterative traversal, scandir() reuses the file types read with the directory entries
+        files: list[tuple[str, dict]] = []
+        directories: list[tuple[str, str]] = [(dir_path, root)]
+        while len(directories) > 0:
+            local_dir, dataset_dir = directories.pop()
+            with os.scandir(local_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        directories.append((entry.path, dataset_dir + entry.name + "/"))
+                    elif entry.is_file():
+                        files.append((entry.path, dict(metadata, filename=entry.name, path=dataset_dir)))
+
+        self.session.logging.debug("TUS UPLOAD -- %s files from directory %s -- PROGRESS", len(files), dir_path)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: list[Future] = [executor.submit(self._tus_upload, file_path, file_metadata, chunk_size) 
+                                     for file_path, file_metadata in files]
+            for future in futures:
+                future.result()
+
+
+    def _tus_upload(self, file_path: str, metadata: dict, chunk_size: Optional[int]=None):
         if not self.suppress_print:
             print(f"Initialising TUS upload with the following metadata:\n"+
                   f"    {metadata}")
             
-        url: str = self.session.API_PATH + "/transfer/upload/"
         status: bool = True
         try:
-            # TODO: Make better check if token is alive
-            self.session.refresh_token()
+            # Token is refreshed only if it is close to expire
+            self.session.check_token()
 
             if not self.suppress_print:
                 print("Initialising TUS client...")
 
-            tus_client: TusClient = TusClient(url,
-                                              headers=self.session.API_HEADER)
+            # The token could be refreshed since the last upload. Only the token is passed, so the JSON content type 
+            # of the API header does not override the content type of TUS requests
+            self._tus_client.set_headers({"Authorization": self.session.API_HEADER["Authorization"]})
             
             self.session.logging.debug(f"TUS UPLOAD -- TUS client initialised -- OK")
             if not self.suppress_print:
                 print(f"Initialising TUS client -- OK\n"+
                       f"Initialising TUS uploader...")
 
-            uploader: Uploader = tus_client.uploader(file_path=file_path, 
-                                                     chunk_size=1048576,
-                                                     metadata=metadata)
+            if chunk_size is None:
+                # Larger chunks need less round trips per file, each PATCH is bounded by chunk_size / RTT
+                chunk_size = max(_TUS_MIN_CHUNK_SIZE, min(_TUS_MAX_CHUNK_SIZE, os.path.getsize(file_path) // 200))
+
+            uploader: Uploader = self._tus_client.uploader(file_path=file_path, 
+                                                           chunk_size=chunk_size,
+                                                           metadata=metadata)
             
             self.session.logging.debug(f"TUS UPLOAD -- TUS upload initialised -- OK")
             if not self.suppress_print:
@@ -436,21 +705,15 @@ class Datasets(object):
         if not self.suppress_print:
             print(f"Retrieving upload status of the datasets...")
 
-        url: str = self.session.API_PATH + "/transfer/status"
+        url: str = self._status_url
 
-        self.session.logging.debug(f"GET -- {url} -- PROGRESS")
-        status_solved: bool = False
+        self.session.logging.debug("GET -- %s -- PROGRESS", url)
         content: list[dict] | DataFrame | None = []
         is_error: bool = True
 
-        while not status_solved:
-            response: Response = req.get(url,
-                                         headers={"Authorization": "Bearer " + self.session.TOKEN})
-            
-            content, status_solved, is_error = self.session.handle_request_status(response, 
-                                                                                  f"GET -- {url}", 
-                                                                                  to_json=True,
-                                                                                  suppress_print=self.suppress_print)        
+        response, content, is_error = self._poll(lambda: self.session.http.get(url, headers=self.session.API_HEADER),
+                                                 f"GET -- {url}",
+                                                 to_json=True)
 
         if not is_error and content_as_pandas:
             content = convert_get_datasets_status_to_pandas(self.session, 
@@ -461,7 +724,7 @@ class Datasets(object):
                 is_error = True
                 self.session.logging.error(f"GET -- {url} -- CONVERT TO DATAFRAME -- FAILED")
             else:
-                self.session.logging.debug(f"GET -- {url} -- CONVERT TO DATAFRAME -- OK")    
+                self.session.logging.debug("GET -- %s -- CONVERT TO DATAFRAME -- OK", url)    
                 
         if is_error:
             if not self.suppress_print:
@@ -478,7 +741,8 @@ class Datasets(object):
 
 
     def get_all_datasets(self, 
-                         content_as_pandas: Optional[bool]=False) -> tuple[list[dict] | DataFrame, int] | tuple[None, None]:
+                         content_as_pandas: Optional[bool]=False,
+                         filters: Optional[dict[str, str]]=None) -> tuple[list[dict] | DataFrame, int] | tuple[None, None]:
         """
             Get all existing datasets
 
@@ -486,6 +750,9 @@ class Datasets(object):
             ----------
             content_as_pandas: bool, optional
                 Convert HTTP response content from JSON to pandas DataFrame. By default: content_as_pandas=False
+            filters: dict[str, str], optional
+                Location of the datasets to be searched for by the server, i.e. any of the keys "access", "project", "zone". 
+                Empty values are ignored. By default: None (i.e. all datasets are returned).
 
             Returns
             -------
@@ -498,21 +765,20 @@ class Datasets(object):
         if not self.suppress_print:
             print(f"Retrieving data of the datasets...")
 
-        url: str = self.session.API_PATH + "/dataset/search/metadata"
+        url: str = self._search_url
+
+        post_body: dict = {}
+        if filters is not None:
+            location: dict[str, str] = {key: value for key, value in filters.items() if value != ""}
+            if len(location) > 0:
+                post_body = {"location": location}
 
-        self.session.logging.debug(f"POST -- {url} -- PROGRESS")
-        status_solved: bool = False
+        self.session.logging.debug("POST -- %s -- PROGRESS", url)
         content: list[dict] | DataFrame | None = None
         is_error: bool = True
-        while not status_solved:
-            response: Response = req.post(url,
-                                          headers=self.session.API_HEADER,
-                                          json={})
-
-            content, status_solved, is_error = self.session.handle_request_status(response, 
-                                                                                  f"POST -- {url}", 
-                                                                                  to_json=True,
-                                                                                  suppress_print=self.suppress_print)
+        response, content, is_error = self._poll(self._json_request("POST", url, post_body),
+                                                 f"POST -- {url}",
+                                                 to_json=True)
         
         if not is_error and content_as_pandas:
             content = convert_get_all_datasets_to_pandas(self.session, 
@@ -524,7 +790,7 @@ class Datasets(object):
                 self.session.logging.error(f"POST -- {url} -- CONVERT TO DATAFRAME -- FAILED")
                 
             else:
-                self.session.logging.debug(f"POST -- {url} -- CONVERT TO DATAFRAME -- OK")
+                self.session.logging.debug("POST -- %s -- CONVERT TO DATAFRAME -- OK", url)
                     
         if is_error:
             if not self.suppress_print:
@@ -540,6 +806,66 @@ class Datasets(object):
             return content, response.status_code
 
 
+    def get_dataset_by_id(self, 
+                          dataset_id: str,
+                          content_as_pandas: Optional[bool]=False) -> tuple[list[dict] | DataFrame, int] | tuple[None, None]:
+        """
+            Get the dataset with specified InternalID. Only the matching dataset is requested from the server 
+            instead of listing all existing datasets.
+
+            Parameters
+            ----------
+            dataset_id : str
+                InternalID of the dataset.
+            content_as_pandas: bool, optional
+                Convert HTTP response content from JSON to pandas DataFrame. By default: content_as_pandas=False
+
+            Returns
+            -------
+            list[dict] | DataFrame | None
+                Content of the HTTP request as JSON or as pandas DataFrame if 'content_as_pandas=True'. Empty if the dataset doesn't exist. 
+                None if some errors have occured.
+            int | None
+                Status of the HTTP request. None if some errors have occured.
+        """
+
+        url: str = self._search_url
+
+        self.session.logging.debug("POST -- %s -- ID:%s -- PROGRESS", url, dataset_id)
+        content: list[dict] | DataFrame | None = None
+        is_error: bool = True
+        response, content, is_error = self._poll(self._json_request("POST", url, {"location": {"internalID": dataset_id}}),
+                                                 f"POST -- {url} -- ID:{dataset_id}",
+                                                 to_json=True)
+        
+        if not is_error:
+            # Keep only the requested dataset in case the server ignores the search query
+            content = [dataset for dataset in content if dataset.get("location", {}).get("internalID") == dataset_id]
+
+            if content_as_pandas:
+                content = convert_get_all_datasets_to_pandas(self.session, 
+                                                             content, 
+                                                             supress_print=self.suppress_print)
+
+                if content is None:
+                    is_error = True
+                    self.session.logging.error(f"POST -- {url} -- ID:{dataset_id} -- CONVERT TO DATAFRAME -- FAILED")
+                    
+                else:
+                    self.session.logging.debug("POST -- %s -- ID:%s -- CONVERT TO DATAFRAME -- OK", url, dataset_id)
+                    
+        if is_error:
+            if not self.suppress_print:
+                print(f"Some errors occurred while retrieving data of the dataset. See log file, please.")
+            if self.session.exception_on_error:
+                raise Py4LexisException(f"Some errors occurred while retrieving data of the dataset. See log file, please.")
+            return None, None
+        else:
+            if self.print_content:
+                print(f"content: {content}")
+            return content, response.status_code
+
+
     def delete_dataset_by_id(self, 
                              dataset_id: str, 
                              access: str, 
@@ -566,26 +892,19 @@ class Datasets(object):
         if not self.suppress_print:
             print(f"Deleting dataset with ID: {dataset_id}")
 
-        url: str = self.session.API_PATH + "/dataset"
+        url: str = self._dataset_url
         delete_body: dict = {
             "access": access,
             "project": project,
             "internalID": dataset_id
         }
 
-        self.session.logging.debug(f"DELETE -- {url} -- ID:{dataset_id} -- PROGRESS")
-        status_solved: bool = False
+        self.session.logging.debug("DELETE -- %s -- ID:%s -- PROGRESS", url, dataset_id)
         content: dict = {}
         is_error: bool = False
-        while not status_solved:
-            response = req.delete(url,
-                                  headers=self.session.API_HEADER,
-                                  json=delete_body)
-
-            content, status_solved, is_error = self.session.handle_request_status(response, 
-                                                                                  f"DELETE -- {url} -- ID:{dataset_id}", 
-                                                                                  to_json=True,
-                                                                                  suppress_print=self.suppress_print)
+        response, content, is_error = self._poll(self._json_request("DELETE", url, delete_body),
+                                                 f"DELETE -- {url} -- ID:{dataset_id}",
+                                                 to_json=True)
 
         if is_error:
             if not self.suppress_print:
@@ -601,6 +920,46 @@ class Datasets(object):
             return content, response.status_code
     
 
+    def delete_datasets_by_ids(self, 
+                               dataset_ids: list[str], 
+                               access: str, 
+                               project: str,
+                               max_workers: Optional[int]=8) -> list[bool]:
+        """
+            Deletes several datasets at once. The DDI deletes one dataset per request, so the requests are sent concurrently 
+            over the pooled connections of the session.
+
+            Parameters
+            ----------
+            dataset_ids : list[str]
+                InternalIDs of the datasets. Can be obtain by get_all_datasets() method.
+            access : str
+                One of the access types [public, project, user]. Can be obtain by get_all_datasets() method.
+            project: str
+                Project's short name in which datasets are stored. Can be obtain by get_all_datasets() method.
+            max_workers : int, optional
+                Maximum number of datasets deleted concurrently. By default, max_workers=8.
+
+            Returns
+            -------
+            list[bool]
+                For each dataset (in the given order), True if it was successfully deleted.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results: list[tuple] = list(executor.map(lambda dataset_id: self.delete_dataset_by_id(dataset_id, access, project), 
+                                                     dataset_ids))
+        deleted: list[bool] = [content is not None for content, _ in results]
+
+        if not all(deleted):
+            if not self.suppress_print:
+                print(f"Some errors occurred while deleting {deleted.count(False)} of {len(dataset_ids)} datasets. See log file, please.")
+        else:
+            if not self.suppress_print:
+                print("Datasets have been deleted...")
+
+        return deleted
+    
+
     def _ddi_submit_download(self, 
                              dataset_id: str, 
                              zone: str, 
@@ -626,7 +985,7 @@ class Datasets(object):
             str | None
                 ID of the request. None if some errors occur
         """
-        url: str = self.session.API_PATH + "/transfer/download"
+        url: str = self._download_url
         download_body: dict = {
             "zone": zone,
             "access": access,
@@ -635,19 +994,12 @@ class Datasets(object):
             "path": path
         }
         
-        status_solved: bool = False
         is_error: bool = False
         content: dict = {}
         try:
-            while not status_solved:
-                response: Response = req.post(url,
-                                              headers=self.session.API_HEADER,
-                                              json=download_body)
-
-                content, status_solved, is_error = self.session.handle_request_status(response, 
-                                                                                      f"POST -- {url} -- DATA_ID:{dataset_id}", 
-                                                                                      to_json=True,
-                                                                                      suppress_print=self.suppress_print)
+            response, content, is_error = self._poll(self._json_request("POST", url, download_body),
+                                                     f"POST -- {url} -- DATA_ID:{dataset_id}",
+                                                     to_json=True)
             
             if not is_error:
                 request_id: str = content["requestId"]
@@ -669,7 +1021,9 @@ class Datasets(object):
     def _ddi_get_download_status(self, 
                                  request_id: str) -> dict:
         """
-            Private method to get download status for the dataset downloading.
+            Private method to get download status for the dataset downloading. 
+            Repeated requests for the same request ID within a short time (_DOWNLOAD_STATUS_TTL) are served from memory
+            unless the download has already reached a terminal state.
 
             Parameters
             ----------
@@ -681,18 +1035,18 @@ class Datasets(object):
             dict
                 Status of the download.
         """
-        url: str = self.session.API_PATH + "/transfer/status/" + request_id
+        cached: tuple[float, dict] | None = self._download_status_cache.get(request_id)
+        if cached is not None and time.monotonic() - cached[0] < _DOWNLOAD_STATUS_TTL:
+            self.session.logging.debug("GET -- STATUS -- REQ_ID:%s -- CACHED -- OK", request_id)
+            return cached[1]
+
+        url: str = self._status_url + "/" + request_id
 
-        status_solved: bool = False
         is_error: bool = False
         content: dict = {}
-        while not status_solved:
-            response: Response = req.get(url, headers=self.session.API_HEADER)
-            
-            content, status_solved, is_error = self.session.handle_request_status(response, 
-                                                                                  f"GET -- {url} -- REQ_ID:{request_id}", 
-                                                                                  to_json=True,
-                                                                                  suppress_print=self.suppress_print)
+        response, content, is_error = self._poll(lambda: self.session.http.get(url, headers=self.session.API_HEADER),
+                                                 f"GET -- {url} -- REQ_ID:{request_id}",
+                                                 to_json=True)
         
         if is_error:
             if not self.suppress_print:
@@ -701,13 +1055,54 @@ class Datasets(object):
                 raise Py4LexisException(f"Some errors occurred while retrieving download status. See log file, please.")
             return None
         else:
+            if content.get("task_state") in _DOWNLOAD_TERMINAL_STATES:
+                self._download_status_cache.pop(request_id, None)
+            else:
+                if len(self._download_status_cache) >= _DOWNLOAD_STATUS_CACHE_SIZE:
+                    self._download_status_cache.pop(next(iter(self._download_status_cache)), None)
+                self._download_status_cache[request_id] = (time.monotonic(), content)
             return content      
 
 
+    def get_download_statuses(self, 
+                              request_ids: list[str]) -> dict[str, dict] | None:
+        """
+            Get download status of several download requests by a single HTTP request.
+
+            Parameters
+            ----------
+            request_ids : list[str]
+                Request IDs obtained by _ddi_submit_download.
+
+            Returns
+            -------
+            dict[str, dict] | None
+                Status of the download for each request ID found on the server, keyed by the request ID. None is returned if some errors have occured.
+        """
+        url: str = self._status_url
+
+        is_error: bool = False
+        content: list[dict] = []
+        response, content, is_error = self._poll(lambda: self.session.http.get(url, headers=self.session.API_HEADER),
+                                                 f"GET -- {url} -- REQ_IDS:{len(request_ids)}",
+                                                 to_json=True)
+        
+        if is_error:
+            if not self.suppress_print:
+                print(f"Some errors occurred while retrieving download statuses. See log file, please.")
+            if self.session.exception_on_error:
+                raise Py4LexisException(f"Some errors occurred while retrieving download statuses. See log file, please.")
+            return None
+        else:
+            requested: set[str] = set(request_ids)
+            return {status["request_id"]: status for status in content if status.get("request_id") in requested}
+
+
     def _ddi_download_dataset(self, 
                               request_id: str, 
                               destination_file: str, 
-                              progress_func: callable = None) -> None:
+                              progress_func: callable = None,
+                              checksum: Optional[str]=None) -> bool:
         """
             Private method providing download of the dataset.
 
@@ -719,47 +1114,117 @@ class Datasets(object):
                 Destination path for the download.
             progress_func : callable, optional
                 Function providing the progress of the download.
+            checksum : str, optional
+                Expected SHA-256 of the download, as hex digest or as iRODS checksum "sha2:BASE64". If set, the digest is computed 
+                while the file is written and the download fails if it doesn't match.
 
             Returns
             -------
-            None
+            bool
+                True if the dataset was successfully downloaded.
         """
-        url: str = self.session.API_PATH + "/transfer/download/" + request_id
+        url: str = self._download_url + "/" + request_id
 
-        status_solved: bool = False
         is_error: bool = False
         content: dict = {}
         try:
-            while not status_solved:
-                response: Response = req.get(url,
-                                             headers=self.session.API_HEADER,
-                                             stream=True)
-                
-                content, status_solved, is_error = self.session.handle_request_status(response, 
-                                                                                      f"GET -- {url} -- REQ_ID:{request_id} -- DOWNLOAD", 
-                                                                                      to_json=False,
-                                                                                      suppress_print=self.suppress_print)
+            # Parts of the ranged download are written concurrently, so they can't be hashed in order
+            total_length: int | None = self._get_ranged_download_size(url) if checksum is None else None
+            if total_length is not None:
+                self.session.logging.debug("GET -- %s -- REQ_ID:%s -- STARTING RANGED DOWNLOAD -- OK", url, request_id)
+                try:
+                    self._ddi_download_ranges(url, destination_file, total_length, progress_func)
+                except IOError as ioe:
+                    # The streamed download is tried as well, it can still resume after interruptions
+                    self.session.logging.warning("GET -- %s -- REQ_ID:%s -- RANGED DOWNLOAD FAILED -- falling back to streamed download: %s", 
+                                                 url, request_id, ioe)
+                    total_length = None
+
+            if total_length is None:
+                # The dataset is already compressed (tar.gz), so the transfer is requested without HTTP compression on top of it
+                response, content, is_error = self._poll(lambda: self.session.http.get(url, 
+                                                                                        headers={**self.session.API_HEADER, "Accept-Encoding": "identity"}, 
+                                                                                        stream=True),
+                                                         f"GET -- {url} -- REQ_ID:{request_id} -- DOWNLOAD",
+                                                         to_json=False,
+                                                         stream=True)
             
-            # File ready, start downloading
-            total_length = response.headers.get("content-length")
-            self.session.logging.debug(f"GET -- {url} -- REQ_ID:{request_id} -- STARTING DOWNLOAD -- OK")
-
-            with open(destination_file, "wb") as f:
-                if total_length is None: # no content length header
-                    f.write(content)
-                else:
-                    dl = 0
-                    total_length = int(total_length)
-                    current: int = int(0)
-                    chunk_size: int = int(4096)
-                    for data in response.iter_content(chunk_size=chunk_size):
-                        if progress_func:
-                            progress_func(current, total_length, prefix='Progress: ', suffix='Downloaded', length=50)
-                            current += chunk_size
-                        dl += len(data)
-                        f.write(data)
-                    if progress_func:
-                        progress_func(total_length, total_length, prefix='Progress: ', suffix='Downloaded', length=50)
+                if not is_error:
+                    # File ready, start downloading
+                    total_length = response.headers.get("content-length")
+                    if total_length is not None:
+                        total_length = int(total_length)
+                    self.session.logging.debug("GET -- %s -- REQ_ID:%s -- STARTING DOWNLOAD -- OK", url, request_id)
+
+                    # Broken transfer can be resumed from the received bytes if the server serves byte ranges of the file as it is
+                    is_resumable: bool = response.headers.get("accept-ranges") == "bytes" \
+                                         and response.headers.get("content-encoding", "identity") == "identity"
+                    resumes: int = 0
+
+                    # Stream the response in large chunks through a large write buffer to keep the number of syscalls low
+                    chunk_size: int = 1024 * 1024
+                    digest: hashlib._Hash | None = hashlib.sha256() if checksum is not None else None
+                    with open(destination_file, "wb", buffering=16 * chunk_size) as f:
+                        # Length of the file is known only if the content is not encoded
+                        is_preallocated: bool = total_length is not None \
+                                                and response.headers.get("content-encoding", "identity") == "identity"
+                        if is_preallocated:
+                            self._preallocate_file(f, total_length)
+
+                        try:
+                            while True:
+                                try:
+                                    if digest is None and (total_length is None or not progress_func): # nothing to hash or report
+                                        # Copy the raw stream directly into the file, the content is still decoded by urllib3 (e.g. gzip)
+                                        response.raw.decode_content = True
+                                        shutil.copyfileobj(response.raw, f, chunk_size)
+                                    else:
+                                        dl: int = f.tell()
+                                        next_report: float = time.monotonic()
+                                        is_reported: bool = progress_func is not None and total_length is not None
+                                        for data in response.iter_content(chunk_size=chunk_size):
+                                            dl += len(data)
+                                            f.write(data)
+                                            if digest is not None:
+                                                digest.update(data)
+                                            # Report the progress at most once per the interval, regardless of the speed
+                                            if is_reported:
+                                                now: float = time.monotonic()
+                                                if now >= next_report:
+                                                    progress_func(dl, total_length, prefix='Progress: ', suffix='Downloaded', length=50)
+                                                    next_report = now + _PROGRESS_REPORT_INTERVAL
+                                        if is_reported:
+                                            progress_func(total_length, total_length, prefix='Progress: ', suffix='Downloaded', length=50)
+                                    break
+
+                                except (RequestException, HTTPError) as err:
+                                    if not is_resumable or resumes == _DOWNLOAD_MAX_RESUMES:
+                                        raise IOError(f"Download interrupted: {err}")
+
+                                    resumes = resumes + 1
+                                    f.flush()
+                                    self.session.logging.warning("GET -- %s -- REQ_ID:%s -- DOWNLOAD INTERRUPTED -- resuming from %d bytes (%d/%d)", 
+                                                                 url, request_id, f.tell(), resumes, _DOWNLOAD_MAX_RESUMES)
+                                    response = self._resume_download(url, f.tell())
+
+                        finally:
+                            if is_preallocated:
+                                # Drop the allocated space the download has not filled, also if the download has failed
+                                f.truncate()
+
+                        if digest is not None:
+                            expected: str = checksum.lower()
+                            if checksum.startswith("sha2:"):
+                                expected = base64.b64decode(checksum[5:]).hex()
+                            if digest.hexdigest() != expected:
+                                raise IOError(f"Checksum of the download '{digest.hexdigest()}' doesn't match the expected '{expected}'")
+                            self.session.logging.debug("GET -- %s -- REQ_ID:%s -- CHECKSUM -- OK", url, request_id)
+
+                        # The archive is usually read once (e.g. extracted), so the kernel is advised not to keep its pages in the page cache 
+                        # at the expense of other processes (pages not written back yet are only scheduled for writeback)
+                        f.flush()
+                        if hasattr(os, "posix_fadvise"):
+                            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
 
         except KeyError as kerr:
             is_error = True
@@ -775,6 +1240,184 @@ class Datasets(object):
                 print(f"Some errors occurred while downloading dataset. See log file, please.")
             if self.session.exception_on_error:
                 raise Py4LexisException(f"Some errors occurred while downloading dataset. See log file, please.")
+        
+        return not is_error
+
+
+    def _resume_download(self, url: str, offset: int) -> Response:
+        """
+            Requests the rest of the download from the offset by a range request.
+
+            Parameters
+            ----------
+            url : str
+                URL of the download.
+            offset : int
+                Number of bytes already received.
+
+            Returns
+            -------
+            Response
+                Streamed response with the rest of the file.
+
+            Raises
+            ------
+            IOError
+                If the server does not serve the rest of the file.
+        """
+        # Refresh token if it is about to expire, the download can take long
+        self.session.check_token()
+        response: Response = self.session.http.get(url, 
+                                                   headers={**self.session.API_HEADER, "Accept-Encoding": "identity", "Range": f"bytes={offset}-"}, 
+                                                   stream=True)
+        if response.status_code != 206 or not response.headers.get("content-range", "").startswith(f"bytes {offset}-"):
+            response.close()
+            raise IOError(f"Download can't be resumed from {offset} bytes, status: '{response.status_code}'")
+
+        return response
+
+
+    def _get_ranged_download_size(self, url: str) -> int | None:
+        """
+            Checks by HEAD request whether the download can be split into concurrent range requests, i.e. the server accepts 
+            byte ranges, sends the file without content encoding and the file is large enough.
+
+            Parameters
+            ----------
+            url : str
+                URL of the download.
+
+            Returns
+            -------
+            int | None
+                Size of the file in bytes if it can be downloaded by ranges. Otherwise None.
+        """
+        try:
+            response: Response = self.session.http.head(url, 
+                                                        headers={**self.session.API_HEADER, "Accept-Encoding": "identity"}, 
+                                                        allow_redirects=True)
+        except IOError:
+            return None
+
+        if not response.ok or response.headers.get("accept-ranges") != "bytes" \
+           or response.headers.get("content-encoding", "identity") != "identity":
+            return None
+
+        size: int = int(response.headers.get("content-length", 0))
+        if size < _RANGED_DOWNLOAD_MIN_SIZE:
+            return None
+
+        return size
+
+
+    @staticmethod
+    def _preallocate_file(f: BinaryIO, length: int) -> None:
+        """
+            Allocates the blocks of the file for the whole download up front, so the filesystem can place them contiguously.
+            Where posix_fallocate is not available (or not supported by the filesystem), the file is only extended to the length.
+
+            Parameters
+            ----------
+            f : BinaryIO
+                File opened for writing.
+            length : int
+                Length of the download in bytes.
+
+            Returns
+            -------
+            None
+        """
+        try:
+            os.posix_fallocate(f.fileno(), 0, length)
+        except (AttributeError, OSError):
+            f.truncate(length)
+
+
+    def _ddi_download_ranges(self, 
+                             url: str, 
+                             destination_file: str, 
+                             total_length: int, 
+                             progress_func: callable = None) -> None:
+        """
+            Downloads the file by _RANGED_DOWNLOAD_PARTS concurrent range requests, each writing into its own part of the destination file.
+
+            Parameters
+            ----------
+            url : str
+                URL of the download.
+            destination_file: str
+                Destination path for the download.
+            total_length : int
+                Size of the file in bytes.
+            progress_func : callable, optional
+                Function providing the progress of the download, called when a part is downloaded.
+
+            Returns
+            -------
+            None
+
+            Raises
+            ------
+            IOError
+                If a part could not be downloaded completely, even after _DOWNLOAD_MAX_RESUMES resumes.
+        """
+        part_size: int = -(-total_length // _RANGED_DOWNLOAD_PARTS)
+
+        with open(destination_file, "wb") as f:
+            self._preallocate_file(f, total_length)
+
+        def download_part(start: int) -> int:
+            end: int = min(start + part_size, total_length) - 1
+            resumes: int = 0
+            with open(destination_file, "r+b") as f:
+                f.seek(start)
+                # Broken or short transfer of the part is resumed from the received bytes
+                while True:
+                    offset: int = f.tell()
+                    reason: str = ""
+                    try:
+                        # Refresh token if it is about to expire, the download can take long
+                        self.session.check_token()
+                        response: Response = self.session.http.get(url, 
+                                                                   headers={**self.session.API_HEADER, "Accept-Encoding": "identity", "Range": f"bytes={offset}-{end}"}, 
+                                                                   stream=True)
+                        with response:
+                            if response.status_code != 206 or not response.headers.get("content-range", "").startswith(f"bytes {offset}-"):
+                                reason = f"not served, status: '{response.status_code}'"
+                            else:
+                                shutil.copyfileobj(response.raw, f, 1024 * 1024)
+                    except (RequestException, HTTPError) as err:
+                        reason = f"interrupted: {err}"
+
+                    if f.tell() == end + 1:
+                        break
+                    if reason == "":
+                        reason = f"incomplete, {f.tell() - offset} bytes received"
+                    if resumes == _DOWNLOAD_MAX_RESUMES:
+                        raise IOError(f"Range bytes={offset}-{end} {reason}")
+
+                    resumes = resumes + 1
+                    self.session.logging.warning("GET -- %s -- RANGE bytes=%d-%d -- %s -- resuming (%d/%d)", 
+                                                 url, offset, end, reason, resumes, _DOWNLOAD_MAX_RESUMES)
+
+                f.flush()
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), start, end - start + 1, os.POSIX_FADV_DONTNEED)
+
+            return end - start + 1
+
+        dl: int = 0
+        try:
+            with ThreadPoolExecutor(max_workers=_RANGED_DOWNLOAD_PARTS) as executor:
+                for part_length in executor.map(download_part, range(0, total_length, part_size)):
+                    dl = dl + part_length
+                    if progress_func:
+                        progress_func(dl, total_length, prefix='Progress: ', suffix='Downloaded', length=50)
+        except Exception:
+            # Parts are missing in the preallocated file, so it is removed instead of left looking complete
+            if os.path.exists(destination_file):
+                os.remove(destination_file)
+            raise
 
 
     def download_dataset(self, 
@@ -783,11 +1426,13 @@ class Datasets(object):
                          project: str,                           
                          zone: Optional[str]="",
                          path: Optional[str]="",
-                         destination_file: Optional[str]="./download.tar.gz") -> None:
+                         destination_file: Optional[str]="./download.tar.gz",
+                         checksum: Optional[str]=None) -> None:
         """
             Downloads dataset by a specified information as access, zone, project, InternalID.
             It is possible to specify by path parameter which exact file in the dataset should be downloaded.
             It is popsible to specify local desination folder. Default is set to = "./download.tar.gz"
+            If the download cache is used, the cached download is reused while the files of the dataset have not changed.
             
             Parameters
             ----------
@@ -803,45 +1448,173 @@ class Datasets(object):
                 Path to exact folder, by default  = "".
             destination_file: str, optional
                 Path to the local destination folder, by default "./download.tar.gz".
+            checksum: str, optional
+                Expected SHA-256 of the downloaded file, as hex digest or as iRODS checksum "sha2:BASE64". 
+                If set, the download fails if it doesn't match. By default, the download is not verified.
 
             Returns
             -------
             None
         """
-        if zone == "":
-            zone = self.session.DFLT_Z
+        zone = zone or self._default_zone
+
+        # Reuse the cached download if the files of the dataset have not changed
+        cache_path: str | None = None
+        fingerprint: str | None = None
+        download_file: str = destination_file
+        if self.download_cache is not None:
+            listing, req_status = self.get_list_of_files_in_dataset(dataset_id, acccess, project, zone, path=path)
+            if req_status is not None:
+                fingerprint = DownloadCache.fingerprint(listing)
+                cache_path = self.download_cache.get_cache_path(dataset_id, zone, acccess, project, path)
+                if self.download_cache.lookup(cache_path, fingerprint):
+                    self.download_cache.copy_to(cache_path, destination_file)
+                    self.session.logging.debug("DOWNLOAD -- ID:%s -- CACHED -- OK", dataset_id)
+                    if not self.suppress_print:
+                        print("Dataset reused from the download cache -- OK!")
+                    return
+                download_file = self.download_cache.get_temp_path(cache_path)
         
-        if not self.suppress_print:
-            print("Submitting download request on server...")
+        try:
+            if not self.suppress_print:
+                print("Submitting download request on server...")
 
-        down_request = self._ddi_submit_download(dataset_id=dataset_id, 
-                                                 zone=zone, 
-                                                 access=acccess,
-                                                 project=project, 
-                                                 path=path)
-        if not self.suppress_print:
-            print("Download submitted!")
+            down_request = self._ddi_submit_download(dataset_id=dataset_id, 
+                                                     zone=zone, 
+                                                     access=acccess,
+                                                     project=project, 
+                                                     path=path)
+            if not self.suppress_print and down_request is not None:
+                print("Download submitted!")
+
+            # Wait until it is ready
+            deadline: float = time.monotonic() + _DOWNLOAD_MAX_WAIT
+            delay: float = _DOWNLOAD_POLL_INITIAL_DELAY
+            is_error: bool = down_request is None
+            is_ready: bool = False
+
+            if not self.suppress_print and not is_error:
+                print("Checking the status of download request, waiting until it is ready...")
+
+            while not is_error and time.monotonic() < deadline:
+                status = self._ddi_get_download_status(request_id=down_request)
+
+                if status is None:
+                    is_error = True
+                    break
+
+                if status["task_state"] == "SUCCESS":
+                    is_ready = True
+                    if not self.suppress_print:
+                        print("Starting downloading the dataset...")
+                    # Download file
+                    if not self.suppress_print:
+                        is_error = not self._ddi_download_dataset(request_id=down_request, destination_file=download_file, progress_func=printProgressBar,
+                                                                  checksum=checksum)
+                    else:
+                        is_error = not self._ddi_download_dataset(request_id=down_request, destination_file=download_file, 
+                                                                  checksum=checksum)
+                    break
+
+                if status["task_state"] == "ERROR" or status["task_state"] == "FAILURE":
+                    is_error = True
+                    self.session.logging.error(f"DOWNLOAD -- REQ_ID:{down_request} -- request failed: {status['task_result']} -- FAILED")
+                    break
+
+                self.session.logging.info("DOWNLOAD -- REQ_ID:%s -- Download request not ready yet, next check in %.1f secs -- OK", down_request, delay)
+
+                # Refresh token if it is about to expire
+                self.session.check_token()
+                time.sleep(delay + random.random() * 0.5)
+                delay = min(_DOWNLOAD_POLL_MAX_DELAY, delay * 1.6)
+        
+            if not is_ready and not is_error:
+                is_error = True
+                self.session.logging.error(f"DOWNLOAD -- REQ_ID:{down_request} -- Not ready within {_DOWNLOAD_MAX_WAIT} secs -- FAILED") 
+
+            if cache_path is not None and not is_error:
+                self.download_cache.store(download_file, cache_path, fingerprint)
+                self.download_cache.copy_to(cache_path, destination_file)
+
+        finally:
+            # Partial download is removed unless it was stored in the cache, also when an exception was raised
+            if cache_path is not None and os.path.exists(download_file):
+                os.remove(download_file)
+
+        if is_error:
+            if not self.suppress_print:
+                print(f"Some errors occurred while downloading dataset. See log file, please.")
+            if self.session.exception_on_error:
+                raise Py4LexisException(f"Some errors occurred while downloading dataset. See log file, please.")
+        else:
+            if not self.suppress_print:
+                print("Dataset successfully downloaded -- OK!")
+
+
+    async def download_dataset_async(self, 
+                                     dataset_id: str,
+                                     access: str, 
+                                     project: str,                           
+                                     zone: Optional[str]="",
+                                     path: Optional[str]="",
+                                     destination_file: Optional[str]="./download.tar.gz",
+                                     checksum: Optional[str]=None) -> bool:
+        """
+            Asynchronous variant of download_dataset(). HTTP requests run in worker threads and the waiting between status checks 
+            does not block the event loop, so several downloads can be awaited together, e.g. by asyncio.gather().
+            
+            Parameters
+            ----------
+            dataset_id: str
+                InternalID of the dataset. Can be obtain by get_all_datasets() method.
+            access : str
+                One of the access types [public, project, user]. Can be obtain by get_all_datasets() method.
+            project: str
+                Project's short name in which dataset is stored. Can be obtain by get_all_datasets() method.
+            zone: str
+                iRODS zone name in which dataset is stored, one of ["IT4ILexisZone", "LRZLexisZone"]. Can be obtain by get_all_datasets() method.
+            path: str, optional
+                Path to exact folder, by default  = "".
+            destination_file: str, optional
+                Path to the local destination folder, by default "./download.tar.gz".
+            checksum: str, optional
+                Expected SHA-256 of the downloaded file, as hex digest or as iRODS checksum "sha2:BASE64". 
+                If set, the download fails if it doesn't match. By default, the download is not verified.
+
+            Returns
+            -------
+            bool
+                True if the dataset was successfully downloaded.
+        """
+        zone = zone or self._default_zone
+
+        down_request = await asyncio.to_thread(self._ddi_submit_download, 
+                                               dataset_id=dataset_id, 
+                                               zone=zone, 
+                                               access=access,
+                                               project=project, 
+                                               path=path)
 
         # Wait until it is ready
-        retries_max: int = 200
-        retries: int = 0
-        delay: int = 5 # secs
-        is_error: bool = False
+        deadline: float = time.monotonic() + _DOWNLOAD_MAX_WAIT
+        delay: float = _DOWNLOAD_POLL_INITIAL_DELAY
+        is_error: bool = down_request is None
+        is_downloaded: bool = False
 
-        if not self.suppress_print:
-            print("Checking the status of download request...")
+        while not is_error and time.monotonic() < deadline:
+            status = await asyncio.to_thread(self._ddi_get_download_status, request_id=down_request)
 
-        while retries < retries_max:
-            status = self._ddi_get_download_status(request_id=down_request)
+            if status is None:
+                is_error = True
+                break
 
             if status["task_state"] == "SUCCESS":
-                if not self.suppress_print:
-                    print("Starting downloading the dataset...")
                 # Download file
-                if not self.suppress_print:
-                    self._ddi_download_dataset(request_id=down_request, destination_file=destination_file, progress_func=printProgressBar)
-                else:
-                    self._ddi_download_dataset(request_id=down_request, destination_file=destination_file)
+                is_downloaded = await asyncio.to_thread(self._ddi_download_dataset, 
+                                                        request_id=down_request, 
+                                                        destination_file=destination_file,
+                                                        checksum=checksum)
+                is_error = not is_downloaded
                 break
 
             if status["task_state"] == "ERROR" or status["task_state"] == "FAILURE":
@@ -849,28 +1622,125 @@ class Datasets(object):
                 self.session.logging.error(f"DOWNLOAD -- REQ_ID:{down_request} -- request failed: {status['task_result']} -- FAILED")
                 break
 
-            self.session.logging.debug(f"DOWNLOAD -- REQ_ID:{down_request} -- waiting for download to become ready -- remaining retries {retries}/{retries_max} -- OK")    
-            
-            if not self.suppress_print:
-                print(f"Download request not ready yet, {retries_max}/{retries} retries remaining")
+            self.session.logging.info("DOWNLOAD -- REQ_ID:%s -- Download request not ready yet, next check in %.1f secs -- OK", down_request, delay)
 
-            # Refresh
-            self.session.refresh_token()
-            retries = retries + 1
-            time.sleep(delay)
+            # Refresh token if it is about to expire
+            await asyncio.to_thread(self.session.check_token)
+            await asyncio.sleep(delay + random.random() * 0.5)
+            delay = min(_DOWNLOAD_POLL_MAX_DELAY, delay * 1.6)
         
-        if retries == retries_max and not is_error:
+        if not is_downloaded and not is_error:
             is_error = True
-            self.session.logging.error(f"DOWNLOAD -- REQ_ID:{down_request} -- Reached maximum retries: {retries}/{retries_max} -- FAILED") 
+            self.session.logging.error(f"DOWNLOAD -- REQ_ID:{down_request} -- Not ready within {_DOWNLOAD_MAX_WAIT} secs -- FAILED") 
 
         if is_error:
             if not self.suppress_print:
-                print(f"Some errors occurred while downloading dataset. See log file, please.")
+                print(f"Some errors occurred while downloading dataset '{dataset_id}'. See log file, please.")
             if self.session.exception_on_error:
                 raise Py4LexisException(f"Some errors occurred while downloading dataset. See log file, please.")
         else:
             if not self.suppress_print:
-                print("Dataset successfully downloaded -- OK!")
+                print(f"Dataset '{dataset_id}' successfully downloaded -- OK!")
+
+        return is_downloaded
+
+
+    def download_datasets(self, 
+                          datasets: list[dict],
+                          max_workers: Optional[int]=8) -> list[bool]:
+        """
+            Downloads several datasets at once. All downloads are submitted concurrently first and then the status of all of them is checked 
+            by a single request per polling interval. Each dataset is downloaded in a thread pool as soon as it is ready, 
+            so the downloads overlap with each other and with the polling.
+
+            Parameters
+            ----------
+            datasets : list[dict]
+                Datasets to be downloaded. Each item holds the parameters of download_dataset() as keys, i.e. "dataset_id", "access", "project"
+                and optionally "zone", "path", "destination_file" and "checksum". By default, destination_file="./DATASET_ID.tar.gz".
+            max_workers : int, optional
+                Maximum number of datasets downloaded concurrently. By default, max_workers=8. 
+                Progress bar is shown only if max_workers=1.
+
+            Returns
+            -------
+            list[bool]
+                For each dataset, True if it was successfully downloaded.
+        """
+        downloaded: list[bool] = [False] * len(datasets)
+        pending: dict[str, int] = {}
+
+        if not self.suppress_print:
+            print(f"Submitting {len(datasets)} download requests on server...")
+
+        deadline: float = time.monotonic() + _DOWNLOAD_MAX_WAIT
+        delay: float = _DOWNLOAD_POLL_INITIAL_DELAY
+
+        progress_func: callable = None
+        if not self.suppress_print and max_workers == 1:
+            progress_func = printProgressBar
+
+        futures: dict[int, Future] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Submit all download requests concurrently, so the server prepares them in the meantime
+            submits: list[Future] = [executor.submit(self._ddi_submit_download, 
+                                                     dataset_id=dataset["dataset_id"], 
+                                                     zone=dataset.get("zone", "") or self._default_zone, 
+                                                     access=dataset["access"],
+                                                     project=dataset["project"], 
+                                                     path=dataset.get("path", ""))
+                                     for dataset in datasets]
+            for i, submit in enumerate(submits):
+                down_request = submit.result()
+                if down_request is not None:
+                    pending[down_request] = i
+
+            # Wait until they are ready and download them in the pool
+            while len(pending) > 0 and time.monotonic() < deadline:
+                statuses = self.get_download_statuses(list(pending))
+                if statuses is None:
+                    break
+
+                for down_request, status in statuses.items():
+                    if status["task_state"] == "SUCCESS":
+                        i = pending.pop(down_request)
+                        destination_file: str = datasets[i].get("destination_file", f"./{datasets[i]['dataset_id']}.tar.gz")
+                        if not self.suppress_print:
+                            print(f"Starting downloading the dataset '{datasets[i]['dataset_id']}'...")
+                        futures[i] = executor.submit(self._ddi_download_dataset, 
+                                                     request_id=down_request, 
+                                                     destination_file=destination_file, 
+                                                     progress_func=progress_func,
+                                                     checksum=datasets[i].get("checksum"))
+
+                    elif status["task_state"] == "ERROR" or status["task_state"] == "FAILURE":
+                        pending.pop(down_request)
+                        self.session.logging.error(f"DOWNLOAD -- REQ_ID:{down_request} -- request failed: {status['task_result']} -- FAILED")
+
+                if len(pending) > 0:
+                    self.session.logging.info("DOWNLOAD -- %d download requests not ready yet, next check in %.1f secs -- OK", len(pending), delay)
+
+                    # Refresh token if it is about to expire
+                    self.session.check_token()
+                    time.sleep(delay + random.random() * 0.5)
+                    delay = min(_DOWNLOAD_POLL_MAX_DELAY, delay * 1.6)
+
+            if len(pending) > 0:
+                self.session.logging.error(f"DOWNLOAD -- REQ_IDS:{list(pending)} -- Not ready within {_DOWNLOAD_MAX_WAIT} secs -- FAILED")
+
+            for i, future in futures.items():
+                downloaded[i] = future.result()
+
+        if not all(downloaded):
+            if not self.suppress_print:
+                print(f"Some errors occurred while downloading {downloaded.count(False)} of {len(datasets)} datasets. See log file, please.")
+            if self.session.exception_on_error:
+                raise Py4LexisException(f"Some errors occurred while downloading datasets. See log file, please.")
+        else:
+            if not self.suppress_print:
+                print("Datasets successfully downloaded -- OK!")
+
+        return downloaded
 
 
     def get_list_of_files_in_dataset(self, 
@@ -907,13 +1777,12 @@ class Datasets(object):
             int | None
                 Status of the HTTP request. None if some errors have occured.
         """
-        if zone == "":
-            zone = self.session.DFLT_Z
+        zone = zone or self._default_zone
 
         if not self.suppress_print:
             print(f"Retrieving data of files in the dataset...")
 
-        url: str = self.session.API_PATH + "/dataset/listing"
+        url: str = self._listing_url
 
         post_body: dict = {
             "internalID": dataset_id,
@@ -924,30 +1793,23 @@ class Datasets(object):
             "zone": zone
         }
 
-        self.session.logging.debug(f"POST -- {url} -- PROGRESS")
-        status_solved: bool = False
+        self.session.logging.debug("POST -- %s -- PROGRESS", url)
         content: list[dict] | DataFrame | None = None
         is_error: bool = True
-        while not status_solved:
-            response: Response = req.post(url,
-                                            headers=self.session.API_HEADER,
-                                            json=post_body)
+        response, content, is_error = self._poll(self._json_request("POST", url, post_body),
+                                                 f"POST -- {url}",
+                                                 to_json=True)
 
-            content, status_solved, is_error = self.session.handle_request_status(response, 
-                                                                                  f"POST -- {url}", 
-                                                                                  to_json=True,
-                                                                                  suppress_print=self.suppress_print)
-
-            if not is_error and content_as_pandas:
-                content = convert_dir_tree_to_pandas(self.session, 
-                                                     content, 
-                                                     supress_print=self.suppress_print)
+        if not is_error and content_as_pandas:
+            content = convert_dir_tree_to_pandas(self.session, 
+                                                 content, 
+                                                 supress_print=self.suppress_print)
 
-                if content is None:
-                    is_error = True
-                    self.session.logging.error(f"POST -- {url} -- DATAFRAME -- FAILED")
-                else:
-                    self.session.logging.debug(f"POST -- {url} -- DATAFRAME -- OK")
+            if content is None:
+                is_error = True
+                self.session.logging.error(f"POST -- {url} -- DATAFRAME -- FAILED")
+            else:
+                self.session.logging.debug("POST -- %s -- DATAFRAME -- OK", url)
 
         if is_error:
             if not self.suppress_print:
@@ -987,17 +1849,19 @@ class Datasets(object):
         if access == "user":
             return f"user/{self._targetProjectHash(project)}/{username}/{internalID}"
         elif access == "project":
-            return f"Path: project/{self._targetProjectHash(project)}/{internalID}"
+            return f"project/{self._targetProjectHash(project)}/{internalID}"
         elif access == "public":
-            return f"Path: public/{self.targetProjectHash(project)}/{internalID}"
+            return f"public/{self._targetProjectHash(project)}/{internalID}"
         else:
             return "No_Dataset_Specified"
 
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _targetProjectHash(project: str) -> str:
         """
             Hashes a project which allows the mapping of projects to paths in iRODS.
+            Hashes are cached, as paths of datasets are typically resolved repeatedly for the same projects.
 
             Parameters:
             -----------
@@ -0,0 +1,258 @@
+from __future__ import annotations
+from typing import Optional
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+
+# Default location and size budget of the cache
+_DEFAULT_CACHE_DIR: str = os.path.join(os.path.expanduser("~"), ".cache", "py4lexis", "datasets")
+_DEFAULT_MAX_SIZE: int = 10 * 1024 * 1024 * 1024 # bytes
+
+
+class DownloadCache(object):
+    def __init__(self,
+                 cache_dir: Optional[str]=_DEFAULT_CACHE_DIR,
+                 max_size: Optional[int]=_DEFAULT_MAX_SIZE) -> None:
+        """
+            A class holds local filesystem cache of downloaded datasets. Each download is stored as
+            CACHE_DIR/DATASET_ID/PATH_HASH.tar.gz together with a fingerprint of the dataset's files (paths and checksums),
+            so the cached download is reused only if the files of the dataset have not changed since.
+
+            Attributes
+            ----------
+            cache_dir : str, optional
+                Directory of the cache. By default: "~/.cache/py4lexis/datasets".
+            max_size : int, optional
+                Maximum size of the cache in bytes. Least recently used downloads are evicted once it is exceeded. By default: 10 GiB.
+
+            Methods
+            -------
+            get_cache_path(dataset_id: str, zone: str, access: str, project: str, path: str) -> str
+                Returns the path of the cached download.
+
+            get_temp_path(cache_path: str) -> str
+                Returns the path of a temporary file for the download within the cache.
+
+            lookup(cache_path: str, fingerprint: str) -> bool
+                Returns True if the download is cached and its files have not changed.
+
+            store(temp_path: str, cache_path: str, fingerprint: str) -> None
+                Moves the finished download into the cache.
+
+            copy_to(cache_path: str, destination_file: str) -> None
+                Copies the cached download to the destination file.
+
+            evict(keep: Optional[str]=None) -> None
+                Removes the least recently used downloads until the cache fits into max_size.
+
+            fingerprint(listing: dict) -> str
+                Returns the fingerprint of the dataset's files from the content of get_list_of_files_in_dataset().
+        """
+        self.cache_dir: str = cache_dir
+        self.max_size: int = max_size
+
+
+    def get_cache_path(self,
+                       dataset_id: str,
+                       zone: str,
+                       access: str,
+                       project: str,
+                       path: str) -> str:
+        """
+            Returns the path of the cached download.
+
+            Parameters
+            ----------
+            dataset_id : str
+                InternalID of the dataset.
+            zone : str
+                iRODS zone name in which dataset is stored.
+            access : str
+                One of the access types [public, project, user].
+            project : str
+                Project's short name in which dataset is stored.
+            path : str
+                Path to exact folder within the dataset.
+
+            Returns
+            -------
+            str
+                Path of the cached download.
+        """
+        path_hash: str = hashlib.blake2b("\0".join([dataset_id, zone, access, project, path]).encode(), digest_size=16).hexdigest()
+
+        return os.path.join(self.cache_dir, dataset_id, path_hash + ".tar.gz")
+
+
+    def get_temp_path(self,
+                      cache_path: str) -> str:
+        """
+            Creates a temporary file for the download within the cache, so the finished download can be moved to the cache atomically.
+            The file is unique, so concurrent downloads of the same dataset (e.g. from several threads) don't write into the same file.
+
+            Parameters
+            ----------
+            cache_path : str
+                Path of the cached download.
+
+            Returns
+            -------
+            str
+                Path of the temporary file.
+        """
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(suffix=".part", prefix=os.path.basename(cache_path) + ".", dir=os.path.dirname(cache_path))
+        os.close(fd)
+
+        return temp_path
+
+
+    def lookup(self,
+               cache_path: str,
+               fingerprint: str) -> bool:
+        """
+            Returns True if the download is cached and its files have not changed.
+
+            Parameters
+            ----------
+            cache_path : str
+                Path of the cached download.
+            fingerprint : str
+                Current fingerprint of the dataset's files.
+
+            Returns
+            -------
+            bool
+                True if the cached download can be reused.
+        """
+        try:
+            with open(cache_path + ".json", "r") as f:
+                is_valid: bool = json.load(f)["fingerprint"] == fingerprint and os.path.isfile(cache_path)
+        except (OSError, KeyError, ValueError):
+            return False
+
+        if is_valid:
+            # Mark as recently used
+            os.utime(cache_path)
+
+        return is_valid
+
+
+    def store(self,
+              temp_path: str,
+              cache_path: str,
+              fingerprint: str) -> None:
+        """
+            Moves the finished download into the cache and evicts old downloads if the cache is too large.
+            The stored download itself is never evicted here, so it can be copied to the destination afterwards.
+
+            Parameters
+            ----------
+            temp_path : str
+                Path of the finished download obtained by get_temp_path().
+            cache_path : str
+                Path of the cached download.
+            fingerprint : str
+                Fingerprint of the dataset's files.
+
+            Returns
+            -------
+            None
+        """
+        os.replace(temp_path, cache_path)
+        with open(cache_path + ".json", "w") as f:
+            json.dump({"fingerprint": fingerprint}, f)
+
+        self.evict(keep=cache_path)
+
+
+    def copy_to(self,
+                cache_path: str,
+                destination_file: str) -> None:
+        """
+            Copies the cached download to the destination file. The file is not linked, so later writes to the destination file 
+            (e.g. another download to the same path) can't change the cached download.
+
+            Parameters
+            ----------
+            cache_path : str
+                Path of the cached download.
+            destination_file : str
+                Destination path for the download.
+
+            Returns
+            -------
+            None
+        """
+        # The destination file is removed first, so a hard link created by older versions does not truncate the cached download
+        if os.path.lexists(destination_file):
+            os.remove(destination_file)
+
+        shutil.copyfile(cache_path, destination_file)
+
+
+    def evict(self,
+              keep: Optional[str]=None) -> None:
+        """
+            Removes the least recently used downloads until the cache fits into max_size.
+
+            Parameters
+            ----------
+            keep : str, optional
+                Path of a cached download which is not removed, e.g. the one just stored. 
+                It still counts into the size of the cache.
+
+            Returns
+            -------
+            None
+        """
+        entries: list[tuple[float, int, str]] = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".tar.gz"):
+                    stat: os.stat_result = os.stat(os.path.join(root, name))
+                    entries.append((stat.st_mtime, stat.st_size, os.path.join(root, name)))
+
+        total_size: int = sum(size for _, size, _ in entries)
+        for _, size, cache_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if cache_path == keep:
+                continue
+            for file in (cache_path, cache_path + ".json"):
+                if os.path.exists(file):
+                    os.remove(file)
+            total_size = total_size - size
+
+
+    @staticmethod
+    def fingerprint(listing: dict) -> str:
+        """
+            Returns the fingerprint of the dataset's files, i.e. hash of their paths, sizes and checksums.
+
+            Parameters
+            ----------
+            listing : dict
+                Content of get_list_of_files_in_dataset() as JSON.
+
+            Returns
+            -------
+            str
+                Fingerprint of the dataset's files.
+        """
+        files: list[str] = []
+        directories: list[tuple[str, dict]] = [("", listing)]
+        while len(directories) > 0:
+            prefix, directory = directories.pop()
+            for item in directory.get("contents", []):
+                name: str = prefix + "/" + str(item.get("name", ""))
+                if item.get("type") == "directory":
+                    directories.append((name, item))
+                else:
+                    files.append(f"{name}\0{item.get('size')}\0{item.get('checksum')}")
+
+        return hashlib.blake2b("\n".join(sorted(files)).encode(), digest_size=16).hexdigest()
\ No newline at end of file
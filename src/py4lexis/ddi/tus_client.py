@@ -3,6 +3,7 @@
     TUS Client derived from tuspy tus client.
 """
 from typing import Dict, Optional
+from requests import Session
 from py4lexis.ddi.uploader import Uploader, AsyncUploader
 
 
@@ -19,15 +20,20 @@ class TusClient:
             along with every request made by the cleint to the server. This may be used to set
             authentication headers. These headers should not include headers required by tus
             protocol. If not set this defaults to an empty dictionary.
+        - http (requests.Session):
+            HTTP session used by all requests of the uploaders, so their connections are reused
+            between the chunks and the uploads. If not set, a new session is created.
 
     :Constructor Args:
         - url (str)
         - headers (Optiional[dict])
+        - http (Optional[requests.Session])
     """
 
-    def __init__(self, url: str, headers: Optional[Dict[str, str]] = None):
+    def __init__(self, url: str, headers: Optional[Dict[str, str]] = None, http: Optional[Session] = None):
         self.url = url
         self.headers = headers or {}
+        self.http = http or Session()
 
     def set_headers(self, headers: Dict[str, str]):
         """
@@ -16,6 +16,36 @@ from py4lexis.utils import printProgressBar
 from math import ceil
 
 
+class _SessionTusRequest(TusRequest):
+    """
+    Tus request which sends the chunk through the HTTP session of the client instead of
+    a new connection per chunk.
+    """
+
+    def __init__(self, uploader):
+        super().__init__(uploader)
+        self.http = uploader.client.http
+
+    def perform(self):
+        """
+        Perform actual request.
+        """
+        try:
+            chunk = self.file.read(self._content_length)
+            self.add_checksum(chunk)
+            resp = self.http.patch(
+                self._url,
+                data=chunk,
+                headers=self._request_headers,
+                verify=self.verify_tls_cert
+            )
+            self.status_code = resp.status_code
+            self.response_content = resp.content
+            self.response_headers = {k.lower(): v for k, v in resp.headers.items()}
+        except requests.exceptions.RequestException as error:
+            raise TusUploadFailed(error)
+
+
 def _verify_upload(request: TusRequest):
     if 200 <= request.status_code < 300:
         return True
@@ -77,7 +107,7 @@ class Uploader(BaseUploader):
 
         Makes request to tus server to create a new upload url for the required file upload.
         """
-        resp = requests.post(
+        resp = self.client.http.post(
             self.client.url, headers=self.get_url_creation_headers(),
             verify=self.verify_tls_cert)
         url = resp.headers.get("location")
@@ -88,7 +118,7 @@ class Uploader(BaseUploader):
         return urljoin(self.client.url, url)
 
     def _do_request(self):
-        self.request = TusRequest(self)
+        self.request = _SessionTusRequest(self)
         try:
             self.request.perform()
             _verify_upload(self.request)
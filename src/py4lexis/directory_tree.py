@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Generator, Optional
+from typing import Generator, Iterator, Optional
 from py4lexis.custom_types.directory_tree import TreeDirectoryObject, TreeFileObject
 
 
@@ -9,7 +9,7 @@ class DirectoryTree(object):
 
         To use it, type
 
-            tree_content = DirectoryObject(content)
+            tree_content = TreeDirectoryObject.from_dict(content)
             items = DirectoryTree.make_tree(tree_content)
             for item in items:
                 item.print()
@@ -76,23 +76,23 @@ class DirectoryTree(object):
         displayable_root: DirectoryTree = cls(tree_content, parent, is_last)
         yield displayable_root
 
-        children: list[TreeDirectoryObject | TreeFileObject] = []
-        for item in tree_content.contents:
-            if item["type"] == "directory":
-                children.append(TreeDirectoryObject(item))
+        # Depth-first traversal with an explicit stack of the opened directories, i.e. (node, its remaining items, number of its items).
+        # Items are converted to objects only when they are reached, so the first nodes are yielded immediately.
+        stack: list[tuple[DirectoryTree, Iterator[tuple[int, TreeDirectoryObject | TreeFileObject]], int]] = [
+            (displayable_root, enumerate(tree_content.iter_items(), start=1), len(tree_content.contents))
+        ]
+        while len(stack) > 0:
+            node, items, n_items = stack[-1]
+            for count, item in items:
+                if item.is_dir:
+                    directory: DirectoryTree = cls(item, node, count == n_items)
+                    yield directory
+                    stack.append((directory, enumerate(item.iter_items(), start=1), len(item.contents)))
+                    break
+                else:
+                    yield cls(item, node, count == n_items)
             else:
-                children.append(TreeFileObject(item))
-
-        count: int = 1
-        for item in children:
-            is_last: bool = count == len(children)
-            if item.is_dir():
-                yield from cls.make_tree(item,
-                                         parent=displayable_root,
-                                         is_last=is_last)
-            else:
-                yield cls(item, displayable_root, is_last)
-            count += 1
+                stack.pop()
 
 
     def to_string(self) -> str:
@@ -129,7 +129,7 @@ class DirectoryTree(object):
                 If object is not a directory then it returns a row for DataFrame table.
         """
 
-        if self.tree_item.is_dir():
+        if self.tree_item.is_dir:
             return None
         else:
             parts: list[str] = ["{!s}".format(self.tree_item.name)]
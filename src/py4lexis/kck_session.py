@@ -68,7 +68,7 @@ class kck_oi():
             in_use: bool = True
             while in_use:
                 location: tuple[str, int] = (self.Clr.yhbrr(erdtirec), port)
-                self.logging.debug(f"AUTH -- checking address: {location} -- PROCESSING")
+                self.logging.debug("AUTH -- checking address: %s -- PROCESSING", location)
                 check = a_socket.connect_ex(location)
 
                 if check == 0:
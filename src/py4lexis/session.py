@@ -2,19 +2,55 @@
 from __future__ import annotations
 from getpass import getpass
 from typing import Optional
-from requests import Response, get
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
 from py4lexis.exceptions import Py4LexisAuthException, Py4LexisException, Py4LexisPostException
 from py4lexis.kck_session import kck_oi
 from py4lexis.helper import Clr, sfouiro, _itbbra
-from requests import get
 from urllib3 import disable_warnings
+from urllib3.connection import HTTPConnection
+from urllib3.util import Retry, make_headers
 from time import perf_counter
+from threading import Lock
 from irods.session import iRODSSession
 import logging
 import json
+import socket
+
+# orjson is optional, it decodes large contents (e.g. listings of datasets) several times faster
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 disable_warnings()
 
+# Token is refreshed this long before it expires
+_TOKEN_EXPIRATION_MARGIN: int = 60 # secs
+
+# Pooled connections send TCP keep-alive probes, so they stay open while idle (e.g. between status checks)
+_SOCKET_OPTIONS: list[tuple[int, int, int]] = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    _SOCKET_OPTIONS = _SOCKET_OPTIONS + [(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30), 
+                                         (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)]
+
+# Transient failures are retried by urllib3 with exponential backoff, honouring the Retry-After header (429, 503). 
+# Responses are retried for idempotent methods only (the default allowed methods), so e.g. a dataset is never created twice.
+_RETRY: Retry = Retry(total=5, 
+                      backoff_factor=0.5, 
+                      status_forcelist=(429, 502, 503, 504), 
+                      respect_retry_after_header=True, 
+                      raise_on_status=False)
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """
+        HTTP adapter whose pooled connections use TCP keep-alive (in addition to the default TCP_NODELAY).
+    """
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs["socket_options"] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
 
 class LexisSession(object):
 
@@ -38,6 +74,8 @@ class LexisSession(object):
                 If True, the exception will be raised on error. By default is set to False.
             log_file : str, optional
                 path to a log file. DEFAULT: "./lexis_logs.log"
+            http : Session
+                Persistent HTTP session (connection pool) used for requests to LEXIS API.
 
             Methods
             -------
@@ -54,7 +92,8 @@ class LexisSession(object):
                                   response: Response, 
                                   log_msg: str, 
                                   to_json: bool = True,
-                                  suppress_print: Optional[bool]=True) -> tuple[dict | bytes, bool, bool]
+                                  suppress_print: Optional[bool]=True,
+                                  stream: Optional[bool]=False) -> tuple[dict | bytes, bool, bool]
                 Method which handles request status. If token is invalid then it tries to refresh it.
         """
         # Exception on error
@@ -79,15 +118,19 @@ class LexisSession(object):
         self._token_retrieved_at: int = 0
         self._token_expiration: int = 0
         self._refresh_expiration: int = 0
+        self._token_lock: Lock = Lock()
 
         self.DFLT_Z: str = self.Clr.get("Z")
         self.API_AIR: str = self.Clr.get("AIR")
         self.API_PATH: str = self.Clr.get("API")
 
+        # Prepare HTTP session reusing connections between requests
+        self.http: Session = self._get_http_session()
+
         # check API if valid
         # TODO: FIX 404 status
-        response: Response = get(self.API_PATH)
-        self.logging.debug(f"Initialise API path '{self.API_PATH}' -- OK")      
+        response: Response = self.http.get(self.API_PATH)
+        self.logging.debug("Initialise API path '%s' -- OK", self.API_PATH)      
         
         is_error: bool = False
         # Initialise LEXIS session
@@ -196,17 +239,19 @@ class LexisSession(object):
     
 
     def check_token(self):
+        """
+            Check user's token and refresh it only if it expires within _TOKEN_EXPIRATION_MARGIN.
+        """
         now: float = perf_counter()
         elapsed: float = now - self._token_retrieved_at
 
-        if elapsed < self._token_expiration and elapsed < self._refresh_expiration:
+        if elapsed < self._token_expiration - _TOKEN_EXPIRATION_MARGIN and elapsed < self._refresh_expiration:
             pass
-        elif elapsed >= self._token_expiration and elapsed < self._refresh_expiration:
+        elif elapsed < self._refresh_expiration:
             self.refresh_token()
         else:
-            print(f"elapsed: {elapsed}")
-            print(f"token exp: {self._token_expiration}")
-            print(f"refrsh exp: {self._refresh_expiration}")
+            self.logging.debug("Token expired -- elapsed: %.1f secs, token expiration: %s secs, refresh expiration: %s secs", 
+                               elapsed, self._token_expiration, self._refresh_expiration)
             if self.exception_on_error:
                 raise Py4LexisException("Token has expired and can't be refreshed. Please, relog the session.")
             
@@ -216,7 +261,8 @@ class LexisSession(object):
 
     def refresh_token(self) -> bool:
         """
-            Refresh user's token.
+            Refresh user's token. Refreshing is serialised between threads sharing the session, 
+            i.e. if another thread has refreshed the token in the meantime, the token is not refreshed again.
 
             Returns
             -------
@@ -224,15 +270,23 @@ class LexisSession(object):
                 True if the tokens were successfully refreshed. Otherwise False.
         """
         is_error: bool = False
+        retrieved_at: float = self._token_retrieved_at
         try:
-            tokens: dict = {}
-            self.logging.debug(f"POST -- AUTH -- REFRESH TOKEN -- PROGRESS")
-            tokens = self.uc.rfsh_token(self.get_refresh_token())                      
-            self.TOKEN = tokens["access_token"]
-            self.REFRESH_TOKEN = tokens["refresh_token"]
-            self._token_retrieved_at = perf_counter()
-            self.API_HEADER = {"Authorization": "Bearer " + self.TOKEN}
-            self.logging.debug(f"POST -- AUTH -- REFRESH TOKEN -- OK")
+            with self._token_lock:
+                if self._token_retrieved_at != retrieved_at:
+                    self.logging.debug(f"POST -- AUTH -- REFRESH TOKEN -- Already refreshed by another thread -- OK")
+                    return True
+
+                tokens: dict = {}
+                self.logging.debug(f"POST -- AUTH -- REFRESH TOKEN -- PROGRESS")
+                tokens = self.uc.rfsh_token(self.get_refresh_token())                      
+                self.TOKEN = tokens["access_token"]
+                self.REFRESH_TOKEN = tokens["refresh_token"]
+                self._token_expiration = tokens.get("expires_in", self._token_expiration)
+                self._refresh_expiration = tokens.get("refresh_expires_in", self._refresh_expiration)
+                self._token_retrieved_at = perf_counter()
+                self.API_HEADER = {"Authorization": "Bearer " + self.TOKEN}
+                self.logging.debug(f"POST -- AUTH -- REFRESH TOKEN -- OK")
 
         except Py4LexisPostException as err:
             is_error = True
@@ -264,7 +318,7 @@ class LexisSession(object):
             content: list[dict] | None = None
             is_error: bool = True
             while not status_solved:          
-                response: Response = get("https://api.lexis.tech/broker/validate_token",#self.Clr.yhbrr(sfouiro) + "/validate_token",
+                response: Response = self.http.get("https://api.lexis.tech/broker/validate_token",#self.Clr.yhbrr(sfouiro) + "/validate_token",
                                         params={
                                             "provider": self.Clr.yhbrr(_itbbra),
                                             "access_token": "Bearer " + self.TOKEN
@@ -296,6 +350,31 @@ class LexisSession(object):
             raise Py4LexisException
 
 
+    def _get_http_session(self) -> Session:
+        """
+            Prepare HTTP session with a pool of keep-alive connections shared by all requests of the LEXIS session.
+            Idle pooled connections are kept open by TCP keep-alive probes.
+            Failed connections of idempotent requests are retried with exponential backoff, as well as their responses with transient errors 
+            (429, 502, 503, 504). Compressed responses are accepted, 
+            i.e. gzip, deflate and brotli if it is installed.
+
+            Returns
+            -------
+            Session
+                Persistent HTTP session.
+        """
+        adapter: HTTPAdapter = _KeepAliveAdapter(pool_connections=16, 
+                                                 pool_maxsize=32, 
+                                                 max_retries=_RETRY)
+        http: Session = Session()
+        http.headers.update(make_headers(accept_encoding=True))
+        http.mount("https://", adapter)
+        http.mount("http://", adapter)
+        self.logging.debug(f"HTTP session -- INITIALISED -- OK")
+
+        return http
+
+
     def _get_irods_session(self) -> iRODSSession:
         """
             Retrieve iRODS session.
@@ -322,7 +401,8 @@ class LexisSession(object):
                               response: Response, 
                               log_msg: str, 
                               to_json: bool = True,
-                              suppress_print: Optional[bool]=True) -> tuple[dict | bytes, bool, bool]:
+                              suppress_print: Optional[bool]=True,
+                              stream: Optional[bool]=False) -> tuple[dict | bytes, bool, bool]:
         """
             Method which handles request status. If token is invalid then it tries to refresh it.
 
@@ -336,6 +416,9 @@ class LexisSession(object):
                 Convert content of response to JSON. By default is set to True.
             suppress_print : bool, optional
                 If True, the errors prints to console will be suppressed.
+            stream : bool, optional
+                If True, the content of a successful response is not read, so it can be streamed by the caller 
+                using response.iter_content(). By default is set to False.
             
             Returns
             -------
@@ -352,12 +435,14 @@ class LexisSession(object):
             if 200 <= response.status_code <= 299:
                 status_solved = True
                 is_error = False
-                if to_json:
-                    content = response.json()
+                if stream:
+                    content = None
+                elif to_json:
+                    content = _json_loads(response.content)
                 else:
                     content = response.content
 
-                self.logging.debug(log_msg + " -- OK")
+                self.logging.debug("%s -- OK", log_msg)
             else:
                 if response.status_code == 404 or response.status_code >= 500:
                     is_error = True
@@ -365,14 +450,14 @@ class LexisSession(object):
                     content = response.content
                 else:
                     content = response.json()
-                    if "errorString" in content.keys():
+                    if "errorString" in content:
                         if content["errorString"] == "Inactive token":
                             self.logging.error(log_msg + " -- TOKEN -- FAILED")
                             is_refreshed: bool = self.refresh_token()
                             if is_refreshed:
                                 status_solved = False
                                 is_error = False
-                                self.logging.debug(log_msg + " -- REFRESH TOKEN -- OK")
+                                self.logging.debug("%s -- REFRESH TOKEN -- OK", log_msg)
                             else:
                                 status_solved = True
                                 is_error = True
@@ -383,7 +468,7 @@ class LexisSession(object):
                             status_solved = True
                             is_error = True
                             self.logging.error(log_msg + f" -- Bad request status: '{response.status_code}' -- FAILED")
-                            self.logging.debug(content)
+                            self.logging.debug("%s -- content: %s", log_msg, content)
 
                             if not suppress_print:
                                 print(log_msg + f" -- Bad request status: '{response.status_code}' -- FAILED")
@@ -391,7 +476,7 @@ class LexisSession(object):
                         status_solved = True
                         is_error = True
                         self.logging.error(log_msg + f" -- Bad request status: '{response.status_code}' -- FAILED")
-                        self.logging.debug(content)
+                        self.logging.debug("%s -- content: %s", log_msg, content)
 
                         if not suppress_print:
                             print(log_msg + f" -- Bad request status: '{response.status_code}' -- FAILED") 
@@ -1,10 +1,34 @@
 
 from __future__ import annotations
-from typing import Generator, Optional
+from typing import TYPE_CHECKING, Generator, Optional
 from py4lexis.custom_types.directory_tree import TreeDirectoryObject
 from py4lexis.directory_tree import DirectoryTree
 from py4lexis.session import LexisSession
-from pandas import DataFrame
+from datetime import date, datetime
+from functools import lru_cache
+
+# pandas is imported by the converters only when they are called
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+# Columns of the converted tables
+_DATASETS_STATUS_COLS: tuple[str, ...] = ("Filename", "Project", "TaskState", "TaskResult",
+                                          "TransferType", "DatasetID", "RequestID", "CreatedAt")
+_ALL_DATASETS_COLS: tuple[str, ...] = ("Title", "Access", "Project", "Zone", "InternalID", "CreationDate",
+                                       "Owner", "Creator", "Contributor", "Publisher", "PublicationYear", 
+                                       "ResourceType", "Compression", "Encryption")
+_DIR_TREE_COLS: tuple[str, ...] = ("Filename", "Path", "Size", "CreateTime", "Checksum")
+
+# Keys of the dataset status in the content and their defaults, in order of _DATASETS_STATUS_COLS
+_DATASETS_STATUS_KEYS: tuple[tuple[str, str], ...] = (("filename", "UKNOWN Filename"), 
+                                                      ("project", "UKNOWN Project"), 
+                                                      ("task_state", "UKNOWN Task State"), 
+                                                      ("task_result", "UKNOWN Task Result"),
+                                                      ("transfer_type", "UKNOWN Transfer Type"), 
+                                                      ("dataset_id", "UKNOWN DatasetID"), 
+                                                      ("request_id", "UKNOWN RequestID"), 
+                                                      ("created_at", "UKNOWN Creation Date"))
 
 
 def printProgressBar(iteration: int, 
@@ -52,6 +76,53 @@ def printProgressBar(iteration: int,
         print()
 
 
+def get_current_year() -> str:
+    """
+        Returns the current year as string. Used as the default publication year of a new dataset.
+
+        Return
+        ------
+        str
+            Current year, e.g. "2023".
+    """
+    return _format_year(date.today().toordinal())
+
+
+@lru_cache(maxsize=1)
+def _format_year(day: int) -> str:
+    """
+        Returns the year of the day as string. The last day is cached, so the year is formatted once per day.
+
+        Parameters
+        ----------
+        day : int
+            Proleptic Gregorian ordinal of the day, i.e. date.toordinal().
+
+        Return
+        ------
+        str
+            Year of the day, e.g. "2023".
+    """
+    return str(date.fromordinal(day).year)
+
+
+def get_default_title(prefix: str) -> str:
+    """
+        Returns the default title of a new dataset as the prefix followed by the current timestamp.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix of the title, e.g. "UNTITLED_Dataset_".
+
+        Return
+        ------
+        str
+            Title in format PREFIX + "%d-%m-%Y_%H:%M:%S".
+    """
+    return prefix + datetime.now().strftime("%d-%m-%Y_%H:%M:%S")
+
+
 def convert_get_datasets_status_to_pandas(session: LexisSession, 
                                           content: list[dict], 
                                           supress_print: Optional[bool]=False) -> DataFrame | None:
@@ -72,11 +143,9 @@ def convert_get_datasets_status_to_pandas(session: LexisSession,
         DataFrame | None
             Status information table of all datasets. None is returned when some errors have occured.
     """
+    from pandas import DataFrame
 
-    cols: list[str] = ["Filename", "Project", "TaskState", "TaskResult",
-                       "TransferType", "DatasetID", "RequestID", "CreatedAt"]
-    
-    datasets_table: DataFrame = DataFrame(columns=cols)
+    datasets_table: DataFrame | None = None
 
     is_error: bool = False
     try:
@@ -85,49 +154,9 @@ def convert_get_datasets_status_to_pandas(session: LexisSession,
         if not supress_print:
             print(f"Converting HTTP content from JSON to pandas Dataframe...")
 
-        for i in range(len(content)):
-            if "filename" in content[i]:
-                filename: str = content[i]["filename"]
-            else:
-                filename: str = str("UKNOWN Filename")
-
-            if "project" in content[i]:
-                project: str = content[i]["project"]
-            else:
-                project: str = str("UKNOWN Project")                
-
-            if "task_state" in content[i]:
-                task_state: str = content[i]["task_state"]
-            else:
-                task_state: str = str("UKNOWN Task State")
-
-            if "task_result" in content[i]:
-                task_result: list[str] | str = content[i]["task_result"]
-            else:
-                task_result: str = str("UKNOWN Task Result")
-
-            if "transfer_type" in content[i]:
-                transfer_type: str = content[i]["transfer_type"]
-            else:
-                transfer_type: str = str("UKNOWN Transfer Type")
-
-            if "dataset_id" in content[i]:
-                dataset_id: str = content[i]["dataset_id"]
-            else:
-                dataset_id: str = str("UKNOWN DatasetID")
-
-            if "request_id" in content[i]:
-                request_id: str = content[i]["request_id"]
-            else:
-                request_id: str = str("UKNOWN RequestID")
-
-            if "created_at" in content[i]:
-                created_at: str = content[i]["created_at"]
-            else:
-                created_at: str = str("UKNOWN Creation Date")
-            
-            datasets_table.loc[i] = [filename, project, task_state, task_result,
-                                     transfer_type, dataset_id, request_id, created_at]
+        datasets_table = DataFrame.from_records([tuple(item.get(key, default) for key, default in _DATASETS_STATUS_KEYS) 
+                                                 for item in content], 
+                                                columns=list(_DATASETS_STATUS_COLS))
         
     except:
         is_error = True
@@ -162,12 +191,9 @@ def convert_get_all_datasets_to_pandas(session: LexisSession,
         DataFrame | None
             Information table of all datasets. None is returned when some errors have occured.
     """
+    from pandas import DataFrame
 
-    cols: list[str] = ["Title", "Access", "Project", "Zone", "InternalID", "CreationDate",
-                        "Owner", "Creator", "Contributor", "Publisher", "PublicationYear", 
-                        "ResourceType", "Compression", "Encryption"]
-    
-    datasets_table: DataFrame = DataFrame(columns=cols)
+    datasets_table: DataFrame | None = None
 
     is_error: bool = False
     try:
@@ -176,123 +202,8 @@ def convert_get_all_datasets_to_pandas(session: LexisSession,
         if not supress_print:
             print(f"Converting HTTP content from JSON to pandas Dataframe...")
 
-        for i in range(len(content)):
-            if "title" in content[i]["metadata"]:
-                title: list[str] | str = content[i]["metadata"]["title"]
-                if type(title) == list:
-                    if len(title) <= 1:
-                        if len(title) == 1:
-                            title: str = title[0]
-                        else: 
-                            title: str = str("UKNOWN Title")
-                    else:
-                        tmp_title: str = ""
-                        for i, title_i in enumerate(title):
-                            if i < (len(title) - 1):
-                                tmp_title = tmp_title + title_i + " "
-                            else:
-                                tmp_title = tmp_title
-                        title = tmp_title
-            else:
-                title: str = str("UKNOWN Title")
-
-            if "access" in content[i]["location"]:
-                access: str = content[i]["location"]["access"]
-            else:
-                access: str = str("UKNOWN Access")
-
-            if "project" in content[i]["location"]:
-                project: str = content[i]["location"]["project"]
-            else:
-                project: str = str("UKNOWN Project")
-
-            if "zone" in content[i]["location"]:
-                zone: str = content[i]["location"]["zone"]
-            else:
-                zone: str = str("UKNOWN Zone")
-
-            if "internalID" in content[i]["location"]:
-                internalID: str = content[i]["location"]["internalID"]
-            else:
-                internalID: str = str("UKNOWN InternalID")
-
-            if "CreationDate" in content[i]["metadata"]:
-                creation_date: str = content[i]["metadata"]["CreationDate"]
-            else:
-                creation_date: str = str("UKNOWN Creation Date")
-
-            if "owner" in content[i]["metadata"]:
-                owner: list[str] = content[i]["metadata"]["owner"]
-            else:
-                owner: list[str] = ["UKNOWN Owner"]
-
-            if "creator" in content[i]["metadata"]:
-                creator: list[str] = content[i]["metadata"]["creator"]
-            else:
-                creator: list[str] = ["UKNOWN Creator"]
-
-            if "contributor" in content[i]["metadata"]:
-                contributor: list[str] = content[i]["metadata"]["contributor"]
-            else:
-                contributor: list[str] = ["UKNOWN Contributor"]
-            
-            if "publisher" in content[i]["metadata"]:
-                publisher: list[str] = content[i]["metadata"]["publisher"]
-            else:
-                publisher: list[str] = ["UKNOWN Publisher"]
-
-            if "publicationYear" in content[i]["metadata"]:
-                publication_year: list[str] | str = content[i]["metadata"]["publicationYear"]
-                if type(publication_year) == list:
-                    if len(publication_year) <= 1:
-                        if len(publication_year) == 1:
-                            publication_year: str = publication_year[0]
-                        else:
-                            publication_year: str = str("UKNOWN Publication Year")
-                    else:
-                        tmp_year: str = ""
-                        for i, year_i in enumerate(publication_year):
-                            if i < (len(publication_year) - 1):
-                                tmp_year = tmp_year + year_i + " "
-                            else:
-                                tmp_year = tmp_year
-                        publication_year = tmp_year
-            else:
-                publication_year: str = str("UKNOWN Publication Year")
-
-            if "resourceType" in content[i]["metadata"]:
-                resource_type: list[str] | str = content[i]["metadata"]["resourceType"]
-                if type(resource_type) == list:
-                    if len(resource_type) <= 1:
-                        if len(resource_type) == 1:
-                            resource_type: str = resource_type[0]
-                        else:
-                            resource_type: str = str("UKNOWN Resource Type")
-                    else:
-                        tmp_resource_type: str = ""
-                        for i, resource_type_i in enumerate(resource_type):
-                            if i < (len(resource_type) - 1):
-                                tmp_resource_type = tmp_resource_type + resource_type_i + " "
-                            else:
-                                tmp_resource_type = tmp_resource_type
-                        resource_type = tmp_resource_type
-            else:
-                resource_type: list = [str("UKNOWN Resource Type")]
-
-            if "compression" in content[i]["metadata"]:
-                compression: str = content[i]["metadata"]["compression"]
-            else:
-                compression: str = str("UKNOWN Compression")
-
-            if "encryption" in content[i]["metadata"]:
-                encryption: str = content[i]["metadata"]["encryption"]
-            else:
-                encryption: str = str("UKNOWN Encryption")
-
-
-            datasets_table.loc[i] = [title, access, project, zone, internalID, creation_date, owner,
-                                     creator, contributor, publisher, publication_year, resource_type,
-                                     compression, encryption]
+        datasets_table = DataFrame.from_records([_get_all_datasets_row(item) for item in content], 
+                                                columns=list(_ALL_DATASETS_COLS))
     
     except:
         is_error = True
@@ -307,6 +218,65 @@ def convert_get_all_datasets_to_pandas(session: LexisSession,
         return datasets_table
       
 
+def _join_values(values: list[str] | str, default: str) -> str:
+    """
+        Joins values of a metadata field given as list into a single string.
+
+        Parameters
+        ----------
+        values : list[str] | str
+            Value(s) of the metadata field.
+        default : str
+            Returned if the list is empty.
+
+        Return
+        ------
+        str
+            The only value, the values separated by space or the default. Other than list values are returned unchanged.
+    """
+    if type(values) != list:
+        return values
+    if len(values) == 0:
+        return default
+    if len(values) == 1:
+        return values[0]
+    return " ".join(values)
+
+
+def _get_all_datasets_row(dataset: dict) -> tuple:
+    """
+        Returns the row of the dataset for the table of convert_get_all_datasets_to_pandas(). 
+        Missing values are replaced by "UKNOWN ..." strings.
+
+        Parameters
+        ----------
+        dataset : dict
+            Dataset as returned in the HTTP response content.
+
+        Return
+        ------
+        tuple
+            Values of the dataset in order of _ALL_DATASETS_COLS.
+    """
+    metadata: dict = dataset["metadata"]
+    location: dict = dataset["location"]
+
+    return (_join_values(metadata.get("title", "UKNOWN Title"), "UKNOWN Title"),
+            location.get("access", "UKNOWN Access"),
+            location.get("project", "UKNOWN Project"),
+            location.get("zone", "UKNOWN Zone"),
+            location.get("internalID", "UKNOWN InternalID"),
+            metadata.get("CreationDate", "UKNOWN Creation Date"),
+            metadata.get("owner", ["UKNOWN Owner"]),
+            metadata.get("creator", ["UKNOWN Creator"]),
+            metadata.get("contributor", ["UKNOWN Contributor"]),
+            metadata.get("publisher", ["UKNOWN Publisher"]),
+            _join_values(metadata.get("publicationYear", "UKNOWN Publication Year"), "UKNOWN Publication Year"),
+            _join_values(metadata.get("resourceType", ["UKNOWN Resource Type"]), "UKNOWN Resource Type"),
+            metadata.get("compression", "UKNOWN Compression"),
+            metadata.get("encryption", "UKNOWN Encryption"))
+      
+
 def convert_dir_tree_to_pandas(session: LexisSession, 
                                content: list[dict],
                                supress_print: Optional[bool]=False) -> DataFrame | None:
@@ -327,10 +297,9 @@ def convert_dir_tree_to_pandas(session: LexisSession,
         DataFrame | None
             List of files in dataset formated into DataFrame table. None is returned when some errors have occured.
     """
+    from pandas import DataFrame
 
-    cols: list[str] = ["Filename", "Path", "Size", "CreateTime", "Checksum"]
-    
-    datasets_table: DataFrame = DataFrame(columns=cols)
+    datasets_table: DataFrame | None = None
 
     is_error: bool = False
     try:
@@ -340,14 +309,11 @@ def convert_dir_tree_to_pandas(session: LexisSession,
             print(f"Converting HTTP content from JSON to pandas Dataframe...")
         
 
-        tree_content: TreeDirectoryObject = TreeDirectoryObject(content)
+        tree_content: TreeDirectoryObject = TreeDirectoryObject.from_dict(content)
         tree_items: Generator[DirectoryTree, None, None] = DirectoryTree.make_tree(tree_content)
-        row_id: int = 0
-        for item in tree_items:
-            row: list[str | int] | None = item.to_dataframe_row()
-            if row is not None:
-                datasets_table.loc[row_id] = item.to_dataframe_row()
-                row_id = row_id + 1
+        # Rows of the files are streamed from the tree into the table, which is created at once
+        datasets_table = DataFrame.from_records(filter(None, map(DirectoryTree.to_dataframe_row, tree_items)), 
+                                                columns=list(_DIR_TREE_COLS))
         
     except:
         is_error = True
@@ -382,6 +348,7 @@ def convert_list_of_dicts_to_pandas(session: LexisSession,
         DataFrame | None
             List of files in dataset formated into DataFrame table. None is returned when some errors have occured.
     """
+    from pandas import DataFrame
 
     if len(content) > 0:
         cols: list[str] = content[0].keys()
@@ -1,6 +1,6 @@
 from typing import Optional
 from pandas import DataFrame
-from requests import Response, post, get
+from requests import Response
 from dateutil import parser
 from datetime import datetime
 from random import random
@@ -50,6 +50,9 @@ class Airflow(object):
         self.print_content = print_content
         self.suppress_print = suppress_print
 
+        # URL of the DAGs is built once, URLs of the workflows are derived from it
+        self._dags_url: str = session.API_AIR + "/dags"
+
 
     def get_workflows_list(self,
                            content_as_pandas: Optional[bool]=False) -> tuple[list[dict] | DataFrame | None, int] | tuple[None, None]:
@@ -72,16 +75,16 @@ class Airflow(object):
         if not self.suppress_print:
             print(f"Retrieving list of existing workflows (DAGs)...")
 
-        url: str = self.session.API_AIR + "/dags"
+        url: str = self._dags_url
 
-        self.session.logging.debug(f"GET -- {url} -- PROGRESS")
+        self.session.logging.debug("GET -- %s -- PROGRESS", url)
         status_solved: bool = False
         content: list[dict] | DataFrame | None = []
         is_error: bool = True
 
         self.session.check_token()
         while not status_solved:
-            response: Response = get(url, headers=self.session.API_HEADER, verify=False)
+            response: Response = self.session.http.get(url, headers=self.session.API_HEADER, verify=False)
             
             content, status_solved, is_error = self.session.handle_request_status(response, 
                                                                                   f"GET -- {url}", 
@@ -97,7 +100,7 @@ class Airflow(object):
                 is_error = True
                 self.session.logging.error(f"GET -- {url} -- CONVERT TO DATAFRAME -- FAILED")
             else:
-                self.session.logging.debug(f"GET -- {url} -- CONVERT TO DATAFRAME -- OK")    
+                self.session.logging.debug("GET -- %s -- CONVERT TO DATAFRAME -- OK", url)    
                 
         if is_error:
             if not self.suppress_print:
@@ -134,16 +137,16 @@ class Airflow(object):
         if not self.suppress_print:
             print(f"Retrieving info about existing workflow (DAG) by its ID...")
 
-        url: str = self.session.API_AIR + "/dags" + "/" + workflow_id
+        url: str = self._dags_url + "/" + workflow_id
 
-        self.session.logging.debug(f"GET -- {url} -- PROGRESS")
+        self.session.logging.debug("GET -- %s -- PROGRESS", url)
         status_solved: bool = False
         content: list[dict] | DataFrame | None = []
         is_error: bool = True
 
         self.session.check_token()
         while not status_solved:
-            response: Response = get(url, headers=self.session.API_HEADER, verify=False)
+            response: Response = self.session.http.get(url, headers=self.session.API_HEADER, verify=False)
             
             content, status_solved, is_error = self.session.handle_request_status(response, 
                                                                                   f"GET -- {url}", 
@@ -185,16 +188,16 @@ class Airflow(object):
         if not self.suppress_print:
             print(f"Retrieving details of existing workflow (DAG) by its ID...")
 
-        url: str = self.session.API_AIR + "/dags" + "/" + workflow_id + "/details"
+        url: str = self._dags_url + "/" + workflow_id + "/details"
 
-        self.session.logging.debug(f"GET -- {url} -- PROGRESS")
+        self.session.logging.debug("GET -- %s -- PROGRESS", url)
         status_solved: bool = False
         content: list[dict] | DataFrame | None = []
         is_error: bool = True
 
         self.session.check_token()
         while not status_solved:
-            response: Response = get(url, headers=self.session.API_HEADER, verify=False)
+            response: Response = self.session.http.get(url, headers=self.session.API_HEADER, verify=False)
             
             content, status_solved, is_error = self.session.handle_request_status(response, 
                                                                                   f"GET -- {url}", 
@@ -235,16 +238,16 @@ class Airflow(object):
         if not self.suppress_print:
             print(f"Retrieving params of existing workflow (DAG) by its ID...")
 
-        url: str = self.session.API_AIR + "/dags" + "/" + workflow_id + "/details"
+        url: str = self._dags_url + "/" + workflow_id + "/details"
 
-        self.session.logging.debug(f"GET -- {url} -- PROGRESS")
+        self.session.logging.debug("GET -- %s -- PROGRESS", url)
         status_solved: bool = False
         content: list[dict] | DataFrame | None = []
         is_error: bool = True
 
         self.session.check_token()
         while not status_solved:
-            response: Response = get(url, headers=self.session.API_HEADER, verify=False)
+            response: Response = self.session.http.get(url, headers=self.session.API_HEADER, verify=False)
             
             content, status_solved, is_error = self.session.handle_request_status(response, 
                                                                                   f"GET -- {url}", 
@@ -262,8 +265,8 @@ class Airflow(object):
             params: dict = content["params"]
             wf_default_parameters: dict = dict()
 
-            for key in params.keys():
-                wf_default_parameters[key] = params[key]["value"]
+            for key, param in params.items():
+                wf_default_parameters[key] = param["value"]
 
             if not self.suppress_print:
                     print("Params of existing workflow (DAG) successfully retrieved -- OK") 
@@ -296,7 +299,7 @@ class Airflow(object):
         if not self.suppress_print:
             print(f"Executing existing workflow (DAG) by its ID...")
 
-        url: str = self.session.API_AIR + "/dags" + "/" +  workflow_id + "/dagRuns"
+        url: str = self._dags_url + "/" + workflow_id + "/dagRuns"
 
         if workflow_run_id is None:
             workflow_run_id: str = "py4lexis_exec_" + datetime.now().isoformat() + "_" + str(round(random() * 100))
@@ -307,14 +310,14 @@ class Airflow(object):
             "dag_run_id": workflow_run_id
         }
 
-        self.session.logging.debug(f"POST -- {url} -- PROGRESS")
+        self.session.logging.debug("POST -- %s -- PROGRESS", url)
         status_solved: bool = False
         content: list[dict] | DataFrame | None = []
         is_error: bool = True
 
         self.session.check_token()
         while not status_solved:
-            response: Response = post(url, headers=self.session.API_HEADER, json=workflow_input, verify=False)
+            response: Response = self.session.http.post(url, headers=self.session.API_HEADER, json=workflow_input, verify=False)
             
             content, status_solved, is_error = self.session.handle_request_status(response, 
                                                                                   f"POST -- {url}", 
@@ -365,16 +368,16 @@ class Airflow(object):
         if not self.suppress_print:
             print(f"Retrieving state of existing workflow (DAG) by its ID...")
 
-        url: str = self.session.API_AIR + "/dags" + "/" +  workflow_id + "/dagRuns"
+        url: str = self._dags_url + "/" + workflow_id + "/dagRuns"
 
-        self.session.logging.debug(f"GET -- {url} -- PROGRESS")
+        self.session.logging.debug("GET -- %s -- PROGRESS", url)
         status_solved: bool = False
         content: list[dict] | DataFrame | None = []
         is_error: bool = True
 
         self.session.check_token()
         while not status_solved:
-            response: Response = get(url, headers=self.session.API_HEADER, verify=False)
+            response: Response = self.session.http.get(url, headers=self.session.API_HEADER, verify=False)
             
             content, status_solved, is_error = self.session.handle_request_status(response, 
                                                                                   f"GET -- {url}", 
@@ -414,7 +417,7 @@ class Airflow(object):
                         raise Py4LexisException(f"Some errors occurred while retrieving run states of existing workflow (DAG) by its ID. See log file, please.")
                     return None, None                    
                 else:
-                    self.session.logging.debug(f"GET -- {url} -- CONVERT TO DATAFRAME -- OK") 
+                    self.session.logging.debug("GET -- %s -- CONVERT TO DATAFRAME -- OK", url) 
 
             if not self.suppress_print:
                     print("Run states of existing workflow (DAG) successfully retrieved -- OK") 